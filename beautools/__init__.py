@@ -1,7 +1,46 @@
-from .cycler import *
-from .hot_cycler import *
-from . import defaultrepo
-from . import repomixins
-from . import files
-from . import yamlfile
-from .utils import *
+import importlib
+
+
+
+# Submodules and their public names are imported on first access (PEP 562), so e.g.
+# `from beautools import first_or_none` does not pay for SQLAlchemy, PyYAML or multiprocessing.
+# __all__ lists only the light lazy names, so `from beautools import *` does not import every submodule
+# or the multiprocessing machinery behind Supervisor and setup_queued_logging.
+_SUBMODULES = (
+        "bimap", "cycler", "decor", "defaultrepo", "dualrepo", "files", "funcs", "hot_cycler", "pipeline",
+        "queuedlog", "repobase", "repomixins", "retention", "supervisor", "testools", "utils", "watchedconfig",
+        "workqueue", "yamlfile",
+)
+_LAZY_ATTRS = {
+        "Cycler": "cycler",
+        "AsyncCycler": "cycler",
+        "HotAsyncCycler": "hot_cycler",
+        "Pipeline": "pipeline",
+        "BiMap": "bimap",
+        "MultiIndex": "bimap",
+        **dict.fromkeys([
+                "RAISE_IF_NONE", "get_or_first", "first_or_none", "map_many", "pmap_many", "applyer",
+                "reverse_dict", "MERGE_STRATEGIES", "merge_many", "merge", "to_async", "normalize_time",
+        ], "utils"),
+}
+_LAZY_ATTRS_NOT_STARRED = {
+        "Supervisor": "supervisor",
+        "setup_queued_logging": "queuedlog",
+}
+__all__ = [*_LAZY_ATTRS]
+
+
+def __getattr__(name):
+    module = _LAZY_ATTRS.get(name) or _LAZY_ATTRS_NOT_STARRED.get(name)
+    if module is not None:
+        value = getattr(importlib.import_module(f".{module}", __name__), name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_SUBMODULES, *_LAZY_ATTRS_NOT_STARRED, *__all__})
@@ -0,0 +1,200 @@
+from collections import defaultdict
+from collections.abc import MutableMapping
+
+
+
+def _as_values(value):
+    # same convention as utils.reverse_dict: a list is many values, anything else is one
+    return value if isinstance(value, list) else [value]
+
+
+class MultiIndex(MutableMapping):
+    """
+    key -> values mapping with an incrementally maintained reverse index value -> keys,
+    a reusable replacement for calling utils.reverse_dict on the same data repeatedly.
+    
+    mode=list or mode=set is the type returned by keys_for() and inverse(), always, whatever the count.
+    Keys of one value keep insertion order.
+    """
+    
+    
+    def __init__(self, data=None, mode=list):
+        if mode not in (list, set):
+            raise ValueError(f"mode must be list or set, not {mode!r}")
+        self.mode = mode
+        self._forward = {}
+        self._reverse = defaultdict(list)
+        if data is not None:
+            self.update(data)
+    
+    
+    # _forward stores the value as given (one value, or a list of distinct values) to keep bulk builds cheap
+    def __getitem__(self, key):
+        return self.mode(_as_values(self._forward[key]))
+    
+    
+    def __setitem__(self, key, value):
+        self.update(((key, value),))
+    
+    
+    def __delitem__(self, key):
+        for v in _as_values(self._forward.pop(key)):
+            self._unlink(v, key)
+    
+    
+    def __iter__(self):
+        return iter(self._forward)
+    
+    
+    def __len__(self):
+        return len(self._forward)
+    
+    
+    def __contains__(self, key):
+        return key in self._forward
+    
+    
+    def add(self, key, value):
+        keys = self._reverse[value]
+        if key in keys:
+            return
+        keys.append(key)
+        if key not in self._forward:
+            self._forward[key] = value
+        elif isinstance(self._forward[key], list):
+            self._forward[key].append(value)
+        else:
+            self._forward[key] = [self._forward[key], value]
+    
+    
+    def discard(self, key, value):
+        keys = self._reverse.get(value)
+        if keys is None or key not in keys:
+            return
+        self._unlink(value, key)
+        values = self._forward[key]
+        if isinstance(values, list):
+            values.remove(value)
+        else:
+            self._forward[key] = []
+    
+    
+    def _unlink(self, value, key):
+        keys = self._reverse[value]
+        keys.remove(key)
+        if not keys:
+            del self._reverse[value]
+    
+    
+    def keys_for(self, value, default=None):
+        keys = self._reverse.get(value)
+        return default if keys is None else self.mode(keys)
+    
+    
+    def has_value(self, value):
+        return value in self._reverse
+    
+    
+    def inverse(self):
+        mode = self.mode
+        return {v: mode(keys) for v, keys in self._reverse.items()}
+    
+    
+    def update(self, data=(), **kwargs):
+        """Bulk insert/replace of key -> value (or list of values)."""
+        pairs = dict(data)
+        pairs.update(kwargs)
+        if self._forward:
+            for key in pairs.keys() & self._forward.keys():
+                del self[key]
+        reverse = self._reverse
+        for key, value in pairs.items():
+            if isinstance(value, list):
+                value = pairs[key] = list(dict.fromkeys(value))
+                for v in value:
+                    reverse[v].append(key)
+            else:
+                reverse[value].append(key)
+        self._forward.update(pairs)
+    
+    
+    @classmethod
+    def from_arrays(cls, keys, values, mode=list):
+        """
+        Builds the index from parallel arrays of (key, value) pairs, grouping with numpy.
+        Useful for millions of integer keys; numpy is only imported here.
+        """
+        import numpy as np
+        
+        keys = np.asarray(keys)
+        values = np.asarray(values)
+        index = cls(mode=mode)
+        index._forward = dict(zip(keys.tolist(), values.tolist()))
+        if len(index._forward) != len(keys):
+            index._forward = {k: list(dict.fromkeys(g)) for k, g in cls._group(keys, values)}
+        index._reverse.update((v, list(dict.fromkeys(g))) for v, g in cls._group(values, keys))
+        return index
+    
+    
+    @staticmethod
+    def _group(by, other):
+        order = by.argsort(kind="stable")
+        by_sorted = by[order]
+        starts = (by_sorted[1:] != by_sorted[:-1]).nonzero()[0] + 1
+        bounds = [0, *starts.tolist(), len(by_sorted)]
+        uniques = by_sorted[bounds[:-1]].tolist() if len(by_sorted) else []
+        other_sorted = other[order].tolist()
+        return ((u, other_sorted[bounds[i]:bounds[i + 1]]) for i, u in enumerate(uniques))
+    
+    
+    def __repr__(self):
+        return f"{self.__class__.__name__}({dict(self.items())!r})"
+
+
+class BiMap(MutableMapping):
+    """One-to-one mapping with O(1) lookups in both directions; .inverse is a BiMap sharing the storage."""
+    
+    
+    def __init__(self, data=None):
+        self._forward = {}
+        self._backward = {}
+        self.inverse = BiMap.__new__(BiMap)
+        self.inverse._forward = self._backward
+        self.inverse._backward = self._forward
+        self.inverse.inverse = self
+        if data is not None:
+            self.update(data)
+    
+    
+    def __getitem__(self, key):
+        return self._forward[key]
+    
+    
+    def __setitem__(self, key, value):
+        owner = self._backward.get(value, key)
+        if owner != key:
+            raise ValueError(f"Value {value!r} is already mapped from {owner!r}")
+        if key in self._forward:
+            del self._backward[self._forward[key]]
+        self._forward[key] = value
+        self._backward[value] = key
+    
+    
+    def __delitem__(self, key):
+        del self._backward[self._forward.pop(key)]
+    
+    
+    def __iter__(self):
+        return iter(self._forward)
+    
+    
+    def __len__(self):
+        return len(self._forward)
+    
+    
+    def __contains__(self, key):
+        return key in self._forward
+    
+    
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self._forward!r})"
@@ -1,10 +1,12 @@
 import asyncio
 import logging
 import time
-import traceback
 
 
 
+logger = logging.getLogger(__name__)
+
+
 class Cycler:
     def __init__(self, name, async_cycled_func=None, DEFAULT_SLEEP=1, WAS_WORK_SLEEP=1, ERROR_SLEEP=1 * 60):
         self.name = name
@@ -19,7 +21,7 @@ class Cycler:
         
         i = 1
         while True:
-            logging.info(f"{self.name}: Cycle {i}")
+            logger.info("%s: Cycle %s", self.name, i)
             wasWork = False
             sleep_time = self.DEFAULT_SLEEP
             try:
@@ -27,11 +29,10 @@ class Cycler:
                 if wasWork:
                     sleep_time = self.WAS_WORK_SLEEP
             except Exception as e:
-                logging.error(e)
-                logging.error(traceback.format_exc())
+                logger.error("%s: Cycle %s failed: %s", self.name, i, e, exc_info=True)
                 sleep_time = self.ERROR_SLEEP
             
-            logging.info(f"{self.name}: Cycle {i} completed. Sleeping for {sleep_time} sec")
+            logger.info("%s: Cycle %s completed. Sleeping for %s sec", self.name, i, sleep_time)
             time.sleep(sleep_time)
             i += 1
     
@@ -54,7 +55,7 @@ class AsyncCycler:
         
         i = 1
         while True:
-            logging.info(f"{self.name}: Cycle {i}")
+            logger.info("%s: Cycle %s", self.name, i)
             wasWork = False
             sleep_time = self.DEFAULT_SLEEP
             try:
@@ -62,11 +63,10 @@ class AsyncCycler:
                 if wasWork:
                     sleep_time = self.WAS_WORK_SLEEP
             except Exception as e:
-                logging.error(e)
-                logging.error(traceback.format_exc())
+                logger.error("%s: Cycle %s failed: %s", self.name, i, e, exc_info=True)
                 sleep_time = self.ERROR_SLEEP
             
-            logging.info(f"{self.name}: Cycle {i} completed. Sleeping for {sleep_time} sec")
+            logger.info("%s: Cycle %s completed. Sleeping for %s sec", self.name, i, sleep_time)
             await asyncio.sleep(sleep_time)
             i += 1
     
@@ -2,18 +2,20 @@ import asyncio
 import functools
 import logging
 import time
-import traceback
 from .utils import to_async
 
 
 
+logger = logging.getLogger(__name__)
+
+
 def catch_print_swallow_exc(func):
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
         try:
             return func(*args, **kwargs)
         except:
-            traceback.print_exc()
+            logger.exception("%s raised", func.__name__)
     
     
     return wrapper
@@ -25,7 +27,7 @@ def a_catch_print_swallow_exc(func):
         try:
             return await func(*args, **kwargs)
         except:
-            traceback.print_exc()
+            logger.exception("%s raised", func.__name__)
     
     
     return wrapper
@@ -39,10 +41,10 @@ def log_execution_time(func):
             result = func(*args, **kwargs)
             return result
         except:
-            traceback.print_exc()
+            logger.exception("%s raised", func.__name__)
         finally:
             end_time = time.perf_counter()
-            logging.warning(f"---- {func.__name__} executed in {end_time - start_time:.6f} seconds")
+            logger.warning("---- %s executed in %.6f seconds", func.__name__, end_time - start_time)
     
     
     return wrapper
@@ -56,10 +58,10 @@ def a_log_execution_time(func, level=logging.INFO):
             result = await func(*args, **kwargs)
             return result
         except:
-            traceback.print_exc()
+            logger.exception("%s raised", func.__name__)
         finally:
             end_time = time.perf_counter()
-            logging.log(level, f"---- {func.__name__} executed in {end_time - start_time:.6f} seconds")
+            logger.log(level, "---- %s executed in %.6f seconds", func.__name__, end_time - start_time)
     
     
     return wrapper
@@ -81,7 +83,7 @@ thread_local.call_indent = 0
 #     return func(args, kwargs) + 1
 # G_F = gunc(func)
 #
-def log_call(level=logging.INFO, logger=logging.getLogger()):
+def log_call(level=logging.INFO, logger=logger):
     def actual_decorator(func):
         if asyncio.iscoroutinefunction(func):
             @functools.wraps(func)
@@ -89,13 +91,13 @@ def log_call(level=logging.INFO, logger=logging.getLogger()):
                 w = 8
                 i = thread_local.call_indent * w
                 thread_local.call_indent += 1
-                logger.log(level, f"{i * ' '}{func.__name__} Start")
+                logger.log(level, "%s%s Start", i * " ", func.__name__)
                 try:
                     res = await to_async(func, *args, **kwargs)
-                    logger.log(level, f"{i * ' '}{func.__name__} Finish")
+                    logger.log(level, "%s%s Finish", i * " ", func.__name__)
                     return res
                 except:
-                    logger.error(f"{i * ' '}{func.__name__} Error")
+                    logger.error("%s%s Error", i * " ", func.__name__)
                     raise
                 finally:
                     thread_local.call_indent -= 1
@@ -105,13 +107,13 @@ def log_call(level=logging.INFO, logger=logging.getLogger()):
         else:
             @functools.wraps(func)
             def wrapper(*args, **kwargs):
-                logger.log(level, f"{func.__name__} Start")
+                logger.log(level, "%s Start", func.__name__)
                 try:
                     res = func(*args, **kwargs)
-                    logger.log(level, f"{func.__name__} Finish")
+                    logger.log(level, "%s Finish", func.__name__)
                     return res
                 except:
-                    logger.error(f"{func.__name__} Error")
+                    logger.error("%s Error", func.__name__)
                     raise
             
             
@@ -0,0 +1,160 @@
+import asyncio
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from .repobase import RepoBase
+
+
+
+def memory_sqlite_engine(echo=False) -> AsyncEngine:
+    """In-memory aiosqlite engine; StaticPool keeps the single connection, so every session sees the same database."""
+    return create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool, echo=echo)
+
+
+# Synchronous operations on a plain Session, the DefaultRepo API. They run inside AsyncSession.run_sync,
+# i.e. in a greenlet over the async engine's connection, so sync and async code share one pool.
+
+def get_all(sess, entity_class, **kwargs):
+    return sess.execute(select(entity_class).filter_by(**kwargs)).scalars().all()
+
+
+def get_first(sess, entity_class, **kwargs):
+    return sess.execute(select(entity_class).filter_by(**kwargs)).scalars().first()
+
+
+def get_or_create(sess, entity_class, **kwargs):
+    obj = get_first(sess, entity_class, **kwargs)
+    if not obj:
+        obj = entity_class(**kwargs)
+        sess.add(obj)
+    return obj
+
+
+def create_if_none(sess, ormobj, **kwargs):
+    obj = get_first(sess, ormobj.__class__, **kwargs)
+    if not obj:
+        obj = ormobj
+        sess.add(obj)
+    return obj
+
+
+def save(sess, *args):
+    sess.add_all(args)
+
+
+def delete(sess, *args):
+    for a in args:
+        sess.delete(a)
+
+
+class SyncRepo:
+    """Blocking face of a DualRepo with the DefaultRepo method names; every call is its own transaction."""
+    
+    
+    def __init__(self, repo):
+        self.repo = repo
+    
+    
+    def run_sync(self, fn, *args, **kwargs):
+        # never the repo's curr_session: that transaction belongs to whichever task opened `async with repo:`
+        return self.repo.run(self.repo._run_sync_own(fn, *args, **kwargs))
+    
+    
+    def get_all(self, entity_class, **kwargs):
+        return self.run_sync(get_all, entity_class, **kwargs)
+    
+    
+    def get_first(self, entity_class, **kwargs):
+        return self.run_sync(get_first, entity_class, **kwargs)
+    
+    
+    def get_or_create(self, entity_class, **kwargs):
+        return self.run_sync(get_or_create, entity_class, **kwargs)
+    
+    
+    def create_if_none(self, ormobj, **kwargs):
+        return self.run_sync(create_if_none, ormobj, **kwargs)
+    
+    
+    def save(self, *args):
+        return self.run_sync(save, *args)
+    
+    
+    def delete(self, *args):
+        return self.run_sync(delete, *args)
+
+
+class DualRepo(RepoBase):
+    """
+    RepoBase that also serves synchronous ORM code over the same AsyncEngine and connection pool.
+    
+    Async code: the RepoBase API, plus `await repo.run_sync(fn, *args)` to run fn(session, *args)
+    with a sync Session (inside `async with repo:` the transaction's session is used).
+    Sync code: `repo.sync.get_all(...)` etc., or `repo.run(coro)` for any async method. These must not be
+    called from a running loop. Pooled connections belong to the loop that opened them, so an async service
+    that also calls the sync face from worker threads passes its loop (or calls bind_loop() in it): calls are
+    then dispatched to that loop. Without a bound loop they run on a private loop, which is only safe when
+    the async API is not used from another loop.
+    """
+    
+    
+    def __init__(self, db: AsyncEngine, loop=None):
+        super().__init__(db)
+        self.sync = SyncRepo(self)
+        self.loop = loop
+        self._loop = None
+    
+    
+    def bind_loop(self, loop=None):
+        """Makes loop (default: the running one) own the pool; sync calls from other threads are sent to it."""
+        self.loop = loop or asyncio.get_running_loop()
+    
+    
+    @classmethod
+    def in_memory(cls, metadata=None, echo=False):
+        """Repo over a fresh in-memory SQLite database, with metadata's tables created. For tests and benchmarks."""
+        repo = cls(memory_sqlite_engine(echo))
+        if metadata is not None:
+            repo.run(repo.create_all(metadata))
+        return repo
+    
+    
+    async def create_all(self, metadata):
+        async with self.db.begin() as conn:
+            await conn.run_sync(metadata.create_all)
+    
+    
+    async def run_sync(self, fn, *args, **kwargs):
+        if self.curr_session is not None:
+            return await self.curr_session.run_sync(fn, *args, **kwargs)
+        return await self._run_sync_own(fn, *args, **kwargs)
+    
+    
+    async def _run_sync_own(self, fn, *args, **kwargs):
+        async with self.asmk() as sess:
+            async with sess.begin():
+                return await sess.run_sync(fn, *args, **kwargs)
+    
+    
+    def run(self, coro):
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            coro.close()
+            raise RuntimeError("Blocking repo call inside a running event loop, use 'await repo.run_sync(...)'")
+        if self.loop is not None and self.loop.is_running():
+            return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(coro)
+    
+    
+    def close(self):
+        """Disposes the pool and closes the private loop used by the sync face."""
+        self.run(self.db.dispose())
+        if self._loop is not None:
+            self._loop.close()
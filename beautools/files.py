@@ -1,15 +1,165 @@
+import collections
+import hashlib
 import json
+import logging
+import mmap
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
 
 import yaml
 
+try:
+    import orjson
+except ImportError:  # optional speedup, see pyproject extras
+    orjson = None
 
 
-def read_yaml(path):
-    with open(path, encoding="utf-8") as f:
-        return yaml.safe_load(f)
 
+logger = logging.getLogger(__name__)
 
-def read_json(path):
-    with open(path, encoding="utf-8") as f:
-        return json.load(f)
+# libyaml bindings are several times faster than the pure-python parser
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
+_parse_cache = {}
+
+
+def _parse_yaml(raw):
+    return yaml.load(raw, Loader=SafeLoader)
+
+
+def _parse_json(raw):
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # NaN, huge ints etc. are accepted only by stdlib json
+    return json.loads(raw)
+
+
+def _disk_cache_path(cache_dir, kind, digest):
+    return os.path.join(cache_dir, f"{kind}-{digest}.pickle")
+
+
+def _load_from_disk(cache_dir, kind, digest):
+    try:
+        with open(_disk_cache_path(cache_dir, kind, digest), "rb") as f:
+            return True, pickle.load(f)
+    except (OSError, pickle.PickleError, EOFError):
+        return False, None
+
+
+def _dump_to_disk(cache_dir, kind, digest, blob):
+    target = _disk_cache_path(cache_dir, kind, digest)
+    tmp = f"{target}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(tmp, "wb") as f:
+            f.write(blob)
+        os.replace(tmp, target)
+    except OSError as e:  # the cache is an optimisation, e.g. a read-only cache_dir must not fail the read
+        logger.warning("%s: cannot write parse cache: %s", cache_dir, e)
+
+
+def _read_parsed(path, kind, parse, cache, cache_dir):
+    """
+    Parses the file at path, skipping the parse when the file is unchanged.
+    
+    In-memory entries are keyed by absolute path and validated by (mtime, size);
+    when the stat changed but the content hash did not, the cached entry is reused.
+    The on-disk cache is keyed by content hash only, so it survives restarts.
+    Entries are kept pickled, so every call returns a fresh object the caller may mutate.
+    """
+    if not cache and cache_dir is None:
+        with open(path, "rb") as f:
+            return parse(f.read())
+    
+    key = (kind, os.path.abspath(path))
+    st = os.stat(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    hit = _parse_cache.get(key) if cache else None
+    if hit is not None and hit[0] == stamp:
+        return pickle.loads(hit[2])
+    
+    with open(path, "rb") as f:
+        raw = f.read()
+    digest = hashlib.sha1(raw).hexdigest()
+    
+    if hit is not None and hit[1] == digest:
+        blob = hit[2]
+        obj = pickle.loads(blob)
+    else:
+        found, obj = _load_from_disk(cache_dir, kind, digest) if cache_dir is not None else (False, None)
+        blob = None
+        if not found:
+            obj = parse(raw)
+            blob = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+            if cache_dir is not None:
+                _dump_to_disk(cache_dir, kind, digest, blob)
+        if cache:
+            blob = blob or pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+    
+    if cache:
+        _parse_cache[key] = (stamp, digest, blob)
+    return obj
+
+
+def read_yaml(path, cache=False, cache_dir=None):
+    """With cache=True/cache_dir unchanged files are not reparsed; each call still returns its own copy."""
+    return _read_parsed(path, "yaml", _parse_yaml, cache, cache_dir)
+
+
+def read_json(path, cache=False, cache_dir=None):
+    """Same caching as read_yaml."""
+    return _read_parsed(path, "json", _parse_json, cache, cache_dir)
+
+
+def clear_cache():
+    _parse_cache.clear()
+
+
+def iter_yaml_documents(path):
+    """Yields documents of a multi-document YAML stream one by one, without loading the whole file."""
+    with open(path, "rb") as f:
+        yield from yaml.load_all(f, Loader=SafeLoader)
+
+
+def iter_line_chunks(path, chunk_size=1 << 20):
+    """Yields mmap-backed bytes chunks of roughly chunk_size, always cut at a line boundary."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            size = len(mm)
+            start = 0
+            while start < size:
+                end = mm.find(b"\n", min(start + chunk_size, size) - 1)
+                end = size if end == -1 else end + 1
+                yield mm[start:end]
+                start = end
+
+
+def _parse_jsonl_chunk(chunk):
+    return [_parse_json(line) for line in chunk.splitlines() if line.strip()]
+
+
+def iter_jsonl(path, processes=None, chunk_size=1 << 20):
+    """
+    Yields records of a JSON-lines file in file order.
+    
+    With processes=N chunks are parsed in a pool of N worker processes; at most
+    2 * N chunks are in flight, so memory stays bounded by chunk_size.
+    """
+    if not processes:
+        for chunk in iter_line_chunks(path, chunk_size):
+            yield from _parse_jsonl_chunk(chunk)
+        return
+    
+    with ProcessPoolExecutor(processes) as pool:
+        pending = collections.deque()
+        for chunk in iter_line_chunks(path, chunk_size):
+            pending.append(pool.submit(_parse_jsonl_chunk, chunk))
+            if len(pending) >= 2 * processes:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
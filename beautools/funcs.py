@@ -1,7 +1,10 @@
 """
 print(mapl(lambda x: x + 1, [1, 2, 3]))
 print(mapc(set, lambda x: x + 1, [1, 2, 3]))
+print(pmapl(abs, range(-1000, 1000)))
 """
+import os
+
 
 
 def mapl(f, it):
@@ -18,3 +21,91 @@ def mapc(collect, f, it):
 
 def filterc(collect, f, it):
     return collect(filter(f, it))
+
+
+def _map_chunk(f, chunk):
+    return [f(x) for x in chunk]
+
+
+def _filter_chunk(f, chunk):
+    return [x for x in chunk if f(x)]
+
+
+def _auto_chunksize(n, workers):
+    # same heuristic as multiprocessing.Pool.map: ~4 chunks per worker
+    return max(1, -(-n // (workers * 4)))
+
+
+def _run_chunked(chunk_func, f, it, executor, workers, chunksize, ordered):
+    import concurrent.futures  # not at module level: keeps mapl & co. import-cheap
+    
+    items = it if isinstance(it, (list, tuple)) else list(it)
+    if not items:
+        return []
+    own_pool = not isinstance(executor, concurrent.futures.Executor)
+    if own_pool:
+        pool_cls = {"process": "ProcessPoolExecutor", "thread": "ThreadPoolExecutor"}[executor]
+        pool = getattr(concurrent.futures, pool_cls)(workers)  # lazily imported by concurrent.futures
+    else:
+        pool = executor
+    workers = getattr(pool, "_max_workers", None) or workers or os.cpu_count() or 1
+    chunksize = chunksize or _auto_chunksize(len(items), workers)
+    try:
+        futures = [pool.submit(chunk_func, f, items[i:i + chunksize]) for i in range(0, len(items), chunksize)]
+        done = futures if ordered else concurrent.futures.as_completed(futures)
+        return [y for fut in done for y in fut.result()]
+    finally:
+        if own_pool:
+            pool.shutdown(cancel_futures=True)
+
+
+def pmapl(f, it, executor="process", workers=None, chunksize=None, ordered=True):
+    """
+    Parallel mapl. executor is "process", "thread" or an existing Executor to reuse.
+    With "process" f and the items must be picklable (module-level functions, no lambdas).
+    ordered=False returns results in completion order of chunks.
+    """
+    return _run_chunked(_map_chunk, f, it, executor, workers, chunksize, ordered)
+
+
+def pfilterl(f, it, executor="process", workers=None, chunksize=None, ordered=True):
+    return _run_chunked(_filter_chunk, f, it, executor, workers, chunksize, ordered)
+
+
+def pmapc(collect, f, it, **kwargs):
+    return collect(pmapl(f, it, **kwargs))
+
+
+def pfilterc(collect, f, it, **kwargs):
+    return collect(pfilterl(f, it, **kwargs))
+
+
+async def amapl(f, it, limit=16, ordered=True):
+    """mapl for a coroutine function f, running at most limit calls concurrently."""
+    import asyncio
+    
+    items = iter(enumerate(it))
+    results = {} if ordered else []
+    
+    
+    async def worker():
+        for i, x in items:
+            y = await f(x)
+            if ordered:
+                results[i] = y
+            else:
+                results.append(y)
+    
+    
+    tasks = [asyncio.ensure_future(worker()) for _ in range(limit)]
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+    return [results[i] for i in range(len(results))] if ordered else results
+
+
+async def amapc(collect, f, it, limit=16, ordered=True):
+    return collect(await amapl(f, it, limit=limit, ordered=ordered))
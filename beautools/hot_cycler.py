@@ -1,10 +1,12 @@
 import asyncio
 import datetime
 import logging
-import traceback
 
 
 
+logger = logging.getLogger(__name__)
+
+
 class HotAsyncCycler:
     HOT_TIMES = [
     ]
@@ -29,25 +31,24 @@ class HotAsyncCycler:
     
     
     async def loop1(self):
-        logging.info(f"{self.name}: loop1")
+        logger.info("%s: loop1", self.name)
         i = 1
         while True:
-            logging.debug("Awaked")
+            logger.debug("Awaked")
             if self.is_default_sleep_passed():
-                logging.info(f"{self.name}: Cycle {i}")
+                logger.info("%s: Cycle %s", self.name, i)
                 self._last_awake = datetime.datetime.now()
                 WAS_WORK = False
                 WAS_ERROR = False
                 try:
                     WAS_WORK = await self.run1()
                 except Exception as e:
-                    logging.error(e)
-                    logging.error(traceback.format_exc())
+                    logger.error("%s: Cycle %s failed: %s", self.name, i, e, exc_info=True)
                     WAS_ERROR = True
                 finally:
                     self._current_sleep = self.refresh_sleeptime(WAS_WORK, WAS_ERROR)
             
-            logging.info(f"{self.name}: Cycle {i} completed. Sleeping for {self._current_sleep} sec")
+            logger.info("%s: Cycle %s completed. Sleeping for %s sec", self.name, i, self._current_sleep)
             await asyncio.sleep(self._current_sleep)
             i += 1
     
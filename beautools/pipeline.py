@@ -0,0 +1,178 @@
+import collections
+import itertools
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+
+_SKIP = object()
+_END = object()
+
+
+def _fuse(ops):
+    """
+    Compiles a run of ("map", f) / ("filter", f) ops into one function,
+    so each element costs one call plus one call per stage, without a generator per stage.
+    """
+    names = {"_SKIP": _SKIP}
+    lines = ["def _fused(x):"]
+    for i, (kind, f) in enumerate(ops):
+        names[f"f{i}"] = f
+        if kind == "map":
+            lines.append(f"    x = f{i}(x)")
+        else:
+            lines.append(f"    if not f{i}(x): return _SKIP")
+    lines.append("    return x")
+    exec("\n".join(lines), names)
+    return names["_fused"]
+
+
+def _batched(it, size, as_array, dtype):
+    if as_array:
+        import numpy  # optional, only needed for array batches
+    it = iter(it)
+    while batch := list(itertools.islice(it, size)):
+        yield numpy.asarray(batch, dtype=dtype) if as_array else batch
+
+
+def _bounded_map(pool, f, it, buffer):
+    # ordered parallel map that never has more than buffer elements in flight
+    pending = collections.deque()
+    try:
+        for x in it:
+            pending.append(pool.submit(f, x))
+            if len(pending) >= buffer:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for fut in pending:
+            fut.cancel()
+
+
+def _prefetched(it, size):
+    # reads the source in a background thread into a bounded queue
+    q = queue.Queue(size)
+    stop = threading.Event()
+    
+    
+    def produce():
+        try:
+            for x in it:
+                while not stop.is_set():
+                    try:
+                        q.put((None, x), timeout=0.1)
+                        break
+                    except queue.Full:
+                        pass
+                if stop.is_set():
+                    return
+            q.put((None, _END))
+        except BaseException as e:
+            q.put((e, _END))
+    
+    
+    threading.Thread(target=produce, daemon=True).start()
+    try:
+        while True:
+            exc, x = q.get()
+            if x is _END:
+                if exc is not None:
+                    raise exc
+                return
+            yield x
+    finally:
+        stop.set()
+
+
+class Pipeline:
+    """
+    Lazy chain of stages, e.g.
+        
+        Pipeline().map(parse).filter(valid).batch(1000).map(score_batch).flat_map(iter).run(source)
+    
+    Adjacent map/filter stages are fused into a single per-element function.
+    Every builder method returns a new Pipeline, so partial pipelines can be reused.
+    """
+    
+    
+    def __init__(self, stages=()):
+        self.stages = tuple(stages)
+    
+    
+    def _then(self, *stage):
+        return Pipeline(self.stages + (stage,))
+    
+    
+    def map(self, f):
+        return self._then("map", f)
+    
+    
+    def filter(self, f):
+        return self._then("filter", f)
+    
+    
+    def flat_map(self, f):
+        return self._then("flat_map", f)
+    
+    
+    def batch(self, size, as_array=False, dtype=None):
+        """Groups elements into lists of size, or numpy arrays with as_array=True."""
+        return self._then("batch", size, as_array, dtype)
+    
+    
+    def take(self, n):
+        return self._then("take", n)
+    
+    
+    def compile(self):
+        """Returns the stages with map/filter runs replaced by ("fused", func)."""
+        compiled = []
+        for kind, group in itertools.groupby(self.stages, key=lambda s: s[0] in ("map", "filter")):
+            group = list(group)
+            if kind:
+                compiled.append(("fused", _fuse(group)))
+            else:
+                compiled.extend(group)
+        return compiled
+    
+    
+    def run(self, iterable, workers=None, buffer=64, prefetch=0):
+        """
+        Returns a lazy iterator over the results.
+        
+        workers=N runs fused stages in a thread pool (ordered, at most buffer elements in flight per stage).
+        prefetch=N reads iterable in a background thread into a queue of N elements.
+        """
+        it = _prefetched(iterable, prefetch) if prefetch else iter(iterable)
+        pool = ThreadPoolExecutor(workers) if workers else None
+        for stage in self.compile():
+            kind = stage[0]
+            if kind == "fused":
+                it = _bounded_map(pool, stage[1], it, buffer) if pool else map(stage[1], it)
+                it = (x for x in it if x is not _SKIP)
+            elif kind == "flat_map":
+                it = itertools.chain.from_iterable(map(stage[1], it))
+            elif kind == "batch":
+                it = _batched(it, *stage[1:])
+            elif kind == "take":
+                it = itertools.islice(it, stage[1])
+        if pool is None:
+            return it
+        return self._shutdown_after(it, pool)
+    
+    
+    @staticmethod
+    def _shutdown_after(it, pool):
+        try:
+            yield from it
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+    
+    
+    def to_list(self, iterable, **run_kwargs):
+        return list(self.run(iterable, **run_kwargs))
+    
+    
+    __call__ = run
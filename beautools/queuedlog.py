@@ -0,0 +1,101 @@
+import logging
+import logging.handlers
+import queue
+
+
+
+LIBRARY_LOGGER = "beautools"
+OVERFLOW_POLICIES = ("drop_new", "drop_oldest", "block")
+
+
+class BoundedQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler over a bounded queue; when it is full the record is handled by the overflow policy."""
+    
+    
+    def __init__(self, q, overflow="drop_new"):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"overflow must be one of {OVERFLOW_POLICIES}, not {overflow!r}")
+        super().__init__(q)
+        self.overflow = overflow
+        self.dropped = 0
+    
+    
+    def enqueue(self, record):
+        if self.overflow == "block":
+            self.queue.put(record)
+            return
+        try:
+            self.queue.put_nowait(record)
+            return
+        except queue.Full:
+            pass
+        if self.overflow == "drop_oldest":
+            try:
+                self.queue.get_nowait()
+                self.queue.put_nowait(record)
+            except (queue.Empty, queue.Full):
+                pass  # raced with the listener or another producer, losing one record either way
+        self.dropped += 1
+
+
+class _Listener(logging.handlers.QueueListener):
+    def enqueue_sentinel(self):
+        self.queue.put(self._sentinel)  # the queue may be full; wait for the thread to make room
+
+
+class QueuedLogging:
+    """
+    Moves handler I/O of a logger (the whole library by default) to a QueueListener thread,
+    so a slow file or network handler does not block cyclers or the event loop.
+    
+    with QueuedLogging(logging.FileHandler("app.log"), maxsize=10000, overflow="drop_oldest"):
+        ...
+    """
+    
+    
+    def __init__(self, *handlers, maxsize=10000, overflow="drop_new", level=None, logger_name=LIBRARY_LOGGER):
+        self.logger = logging.getLogger(logger_name)
+        self.level = level
+        self.handler = BoundedQueueHandler(queue.Queue(maxsize), overflow)
+        self.listener = _Listener(self.handler.queue, *(handlers or [logging.StreamHandler()]), respect_handler_level=True)
+        self._saved = None
+    
+    
+    @property
+    def dropped(self):
+        return self.handler.dropped
+    
+    
+    def start(self):
+        if self._saved is not None:
+            return self
+        self._saved = (self.logger.level, self.logger.propagate)
+        if self.level is not None:
+            self.logger.setLevel(self.level)
+        self.logger.propagate = False  # parent handlers would run synchronously in the caller
+        self.logger.addHandler(self.handler)
+        self.listener.start()
+        return self
+    
+    
+    def stop(self):
+        """Detaches the queue handler and flushes queued records to the handlers."""
+        if self._saved is None:
+            return
+        self.logger.removeHandler(self.handler)
+        level, self.logger.propagate = self._saved
+        self.logger.setLevel(level)
+        self._saved = None
+        self.listener.stop()
+    
+    
+    def __enter__(self):
+        return self.start()
+    
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+
+def setup_queued_logging(*handlers, maxsize=10000, overflow="drop_new", level=None, logger_name=LIBRARY_LOGGER):
+    return QueuedLogging(*handlers, maxsize=maxsize, overflow=overflow, level=level, logger_name=logger_name).start()
@@ -1,29 +1,118 @@
+import contextlib
+import itertools
 import logging
-from sqlalchemy import select
+import time
+
+from sqlalchemy import event, inspect, select, update
 from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+from sqlalchemy.orm.attributes import set_committed_value
 
 
 
 logger = logging.getLogger(__name__)
 
 
+def _pk_keys(mapper):
+    return tuple(mapper.get_property_by_column(col).key for col in mapper.primary_key)
+
+
+def _changed_columns(state):
+    """Keys of modified column attributes, or None if a primary key or a relationship changed (needs a merge)."""
+    if any(state.attrs[rel.key].history.has_changes() for rel in state.mapper.relationships):
+        return None
+    changed = tuple(attr.key for attr in state.mapper.column_attrs if state.attrs[attr.key].history.has_changes())
+    if any(key in changed for key in _pk_keys(state.mapper)):
+        return None
+    return changed
+
+
+class _EngineLoad:
+    def __init__(self, engine, role, maker=None):
+        self.engine = engine
+        self.role = role
+        self.maker = maker
+        self.in_flight = 0
+        self.reads = 0
+    
+    
+    def report(self):
+        return {"engine": repr(self.engine.url), "role": self.role, "in_flight": self.in_flight, "reads": self.reads}
+
+
 class RepoBase:
-    def __init__(self, db: AsyncEngine):
+    ROUTINGS = ("round_robin", "least_loaded")
+    
+    
+    def __init__(self, db: AsyncEngine, replicas=(), routing="round_robin", read_your_writes=1.0):
+        """
+        db is the primary. Plain reads (get_all/get_first) go to replicas, chosen round-robin or by fewest
+        in-flight queries. They stay on the primary, in their own sessions, while `async with repo:` is open and
+        for read_your_writes seconds after a transaction that committed writes, so a caller reads back what it
+        just wrote. tx_get_all/tx_get_first read through the open transaction, uncommitted rows included.
+        """
+        if routing not in self.ROUTINGS:
+            raise ValueError(f"routing must be one of {self.ROUTINGS}, not {routing!r}")
         self.db = db
         self.asmk = async_sessionmaker(self.db, expire_on_commit=False)
         self.curr_session = None
         self._ctx_manager = None
         self.in_transaction = False
+        self.routing = routing
+        self.read_your_writes = read_your_writes
+        self._last_write = None
+        self._wrote = False
+        self._primary_load = _EngineLoad(db, "primary")
+        self._replica_loads = [_EngineLoad(r, "replica", async_sessionmaker(r, expire_on_commit=False)) for r in replicas]
+        self._rr = itertools.cycle(self._replica_loads)
+    
+    
+    def engine_load(self):
+        """Per-engine in-flight and total routed reads."""
+        return [load.report() for load in (self._primary_load, *self._replica_loads)]
+    
+    
+    def _pick_read(self):
+        if not self._replica_loads or self.in_transaction:
+            return self._primary_load
+        if self._last_write is not None and time.monotonic() - self._last_write < self.read_your_writes:
+            return self._primary_load
+        if self.routing == "least_loaded":
+            return min(self._replica_loads, key=lambda load: (load.in_flight, load.reads))
+        return next(self._rr)
+    
+    
+    @contextlib.asynccontextmanager
+    async def _read_session(self):
+        load = self._pick_read()
+        load.in_flight += 1
+        load.reads += 1
+        try:
+            async with (load.maker or self.asmk)() as sess:
+                yield sess
+        finally:
+            load.in_flight -= 1
+    
+    
+    def _mark_write(self, *args):
+        self._wrote = True
+    
+    
+    def _on_orm_execute(self, orm_execute_state):
+        if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+            self._wrote = True
     
     
     async def __aenter__(self):
         if self.curr_session is None:
             try:
                 self.curr_session = self.asmk()
+                self._wrote = False
+                event.listen(self.curr_session.sync_session, "after_flush", self._mark_write)
+                event.listen(self.curr_session.sync_session, "do_orm_execute", self._on_orm_execute)
                 self._ctx_manager = self.curr_session.begin()
                 await self._ctx_manager.__aenter__()
             except Exception as e:
-                logger.error(f"Error starting session: {e}")
+                logger.error("Error starting session: %s", e)
                 raise
         self.in_transaction = True
         return self
@@ -36,9 +125,11 @@ class RepoBase:
         
         try:
             await self._ctx_manager.__aexit__(exc_type, exc_val, exc_tb)
+            if exc_type is None and self._wrote:
+                self._last_write = time.monotonic()  # committed; rollbacks and read-only blocks do not pin reads
             await self.curr_session.close()
         except Exception as e:
-            logger.error(f"Error closing session: {e}")
+            logger.error("Error closing session: %s", e)
             raise
         finally:
             self._ctx_manager = None
@@ -52,19 +143,34 @@ class RepoBase:
     
     
     async def get_all(self, entity_class, **kwargs):
-        async with self.asmk() as sess:
+        async with self._read_session() as sess:
             stmt = select(entity_class).filter_by(**kwargs)
             execres = await sess.execute(stmt)
             return execres.scalars().all()
     
     
     async def get_first(self, entity_class, **kwargs):
-        async with self.asmk() as sess:
+        async with self._read_session() as sess:
             stmt = select(entity_class).filter_by(**kwargs)
             execres = await sess.execute(stmt)
             return execres.scalars().first()
     
     
+    async def tx_get_all(self, entity_class, **kwargs):
+        """get_all through the open transaction's session, so its own uncommitted rows are visible."""
+        if not self.curr_session:
+            raise RuntimeError("No active session. Use 'async with repo:'")
+        execres = await self.curr_session.execute(select(entity_class).filter_by(**kwargs))
+        return execres.scalars().all()
+    
+    
+    async def tx_get_first(self, entity_class, **kwargs):
+        if not self.curr_session:
+            raise RuntimeError("No active session. Use 'async with repo:'")
+        execres = await self.curr_session.execute(select(entity_class).filter_by(**kwargs))
+        return execres.scalars().first()
+    
+    
     async def create_if_none(self, ormobj, **kwargs):
         if not self.curr_session:
             raise RuntimeError("No active session. Use 'async with repo:'")
@@ -85,10 +191,52 @@ class RepoBase:
             self.curr_session.merge(arg)
     
     async def update(self, *args):
+        """
+        Writes only modified columns. Detached objects with column-only changes are grouped by their
+        changed-column set and sent as one executemany UPDATE ... WHERE pk = :pk per group; new objects and
+        relationship or primary key changes are still merged. onupdate columns (e.g. TimestampMixin.modified)
+        are written by the UPDATE but keep their previous value on the object; reload it to see the new one.
+        The grouped UPDATE bypasses version_id_col checks.
+        """
         if not self.curr_session:
             raise RuntimeError("No active session. Use 'async with repo:'")
+        groups = {}
         for arg in args:
-            await  self.curr_session.merge(arg)
+            state = inspect(arg)
+            if state.session_id == self.curr_session.sync_session.hash_key:
+                continue  # flushed by the unit of work, which already emits only dirty columns
+            changed = _changed_columns(state) if state.key is not None else None
+            if changed is None:
+                await self.curr_session.merge(arg)
+            elif changed:
+                groups.setdefault((state.mapper, changed), []).append(arg)
+        
+        for (mapper, changed), objs in groups.items():
+            pk_keys = _pk_keys(mapper)
+            rows = [{key: obj.__dict__[key] for key in (*pk_keys, *changed)} for obj in objs]
+            await self.curr_session.execute(update(mapper.class_), rows)
+            for obj in objs:
+                for key in changed:
+                    set_committed_value(obj, key, obj.__dict__[key])
+    
+    
+    async def bulk_update(self, entity_class, rows):
+        """
+        UPDATE by primary key from plain dicts: [{pk: ..., col: ...}, ...]. Rows with the same key set
+        share one executemany. Returns the number of rows sent.
+        """
+        if not self.curr_session:
+            raise RuntimeError("No active session. Use 'async with repo:'")
+        pk_keys = _pk_keys(inspect(entity_class))
+        groups = {}
+        for row in rows:
+            missing = [key for key in pk_keys if key not in row]
+            if missing:
+                raise ValueError(f"bulk_update row without primary key {missing}: {row!r}")
+            groups.setdefault(tuple(sorted(row)), []).append(row)
+        for group in groups.values():
+            await self.curr_session.execute(update(entity_class), group)
+        return sum(len(group) for group in groups.values())
     
     async def upsert(self, *args):
         if not self.curr_session:
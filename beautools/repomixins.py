@@ -1,4 +1,6 @@
 import datetime
+import os
+import time
 import uuid
 from typing import Annotated
 
@@ -8,15 +10,38 @@ from sqlalchemy.sql import func
 
 
 
-def auto_repr(cls):
+def auto_repr(cls=None, *, fields=None, max_len=10):
+    """
+    Adds a __repr__ listing the table's columns (or the given fields), each value repr cut to max_len.
+    Only already loaded attributes are shown, expired/deferred ones never trigger a query.
+    Usable as @auto_repr or @auto_repr(fields=[...], max_len=...).
+    """
+    fmt = "{}={!r}" if max_len is None else f"{{}}={{!r:.{max_len}}}"
+    names_by_class = {}
+    
+    
+    def column_names(klass):
+        names = names_by_class.get(klass)
+        if names is None:
+            names = names_by_class[klass] = tuple(fields if fields is not None else klass.__table__.columns.keys())
+        return names
+    
+    
     def __repr__(self):
-        columns = self.__table__.columns.keys()
-        values = {col: getattr(self, col) for col in columns}
-        return f"{self.__class__.__name__}({', '.join(f'{k}={v!r:.10}' for k, v in values.items())})"
+        loaded = self.__dict__  # the ORM instance dict holds exactly the loaded attributes
+        values = ", ".join(fmt.format(k, loaded[k]) if k in loaded else f"{k}=<not loaded>"
+                           for k in column_names(self.__class__))
+        return f"{self.__class__.__name__}({values})"
     
     
-    cls.__repr__ = __repr__
-    return cls
+    def decorate(klass):
+        if fields is not None or hasattr(klass, "__table__"):
+            column_names(klass)  # mixins without a table are resolved on first repr of each subclass
+        klass.__repr__ = __repr__
+        return klass
+    
+    
+    return decorate if cls is None else decorate(cls)
 
 
 def utcnow():
@@ -27,12 +52,73 @@ def undashed_uuid() -> str:
     return uuid.uuid4().hex.upper()
 
 
+_VERSION4 = bytes(b & 0x0F | 0x40 for b in range(256))
+_VERSION7 = bytes(b & 0x0F | 0x70 for b in range(256))
+_VARIANT = bytes(b & 0x3F | 0x80 for b in range(256))
+_RAND74_MASK = (1 << 74) - 1
+_CROCKFORD32 = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+_CROCKFORD32_PAIRS = [a + b for a in _CROCKFORD32 for b in _CROCKFORD32]
+
+
+def _now_ms():
+    return time.time_ns() // 1_000_000
+
+
+def _uuid_hexes(n, version, ms=None):
+    buf = bytearray(os.urandom(16 * n))
+    if ms is not None:
+        # one C-level slice assignment per timestamp byte instead of per key
+        for i, byte in enumerate(ms.to_bytes(6)):
+            buf[i::16] = bytes((byte,)) * n
+    buf[6::16] = buf[6::16].translate(version)
+    buf[8::16] = buf[8::16].translate(_VARIANT)
+    hexes = buf.hex().upper()
+    return [hexes[i:i + 32] for i in range(0, 32 * n, 32)]
+
+
+def _ulid_str(value):
+    # 130 bits as 13 ten-bit lookups, base64.b32encode is pure python and uses another alphabet
+    return "".join([_CROCKFORD32_PAIRS[value >> shift & 0x3FF] for shift in range(120, -1, -10)])
+
+
+def undashed_uuid7() -> str:
+    """Time-ordered UUIDv7 in the undashed_uuid format, keeps B-tree inserts append-mostly."""
+    rand74 = int.from_bytes(os.urandom(10)) & _RAND74_MASK
+    # 48 bit unix ms | version 7 | 12 bit rand_a | variant 0b10 | 62 bit rand_b
+    value = _now_ms() << 80 | 0x7 << 76 | (rand74 >> 62) << 64 | 0x2 << 62 | rand74 & (1 << 62) - 1
+    return f"{value:032X}"
+
+
+def ulid() -> str:
+    """26 char ULID: 48 bit ms timestamp + 80 random bits, Crockford base32."""
+    return _ulid_str(_now_ms() << 80 | int.from_bytes(os.urandom(10)))
+
+
+def undashed_uuids(n) -> list[str]:
+    """n uuid4 keys in the undashed_uuid format from a single os.urandom call."""
+    return _uuid_hexes(n, _VERSION4)
+
+
+def undashed_uuid7s(n) -> list[str]:
+    """n UUIDv7 keys from a single os.urandom call, sorted so a bulk insert stays in key order."""
+    return sorted(_uuid_hexes(n, _VERSION7, _now_ms()))
+
+
+def ulids(n) -> list[str]:
+    """n ULIDs from a single os.urandom call, sorted."""
+    ts = _now_ms() << 80
+    raw = os.urandom(10 * n)
+    return sorted(_ulid_str(ts | int.from_bytes(raw[i:i + 10])) for i in range(0, 10 * n, 10))
+
+
 
 intpk = Annotated[int, mapped_column(primary_key=True)]
 strpk = Annotated[str, mapped_column(primary_key=True)]
 uuidpk = Annotated[str, mapped_column(primary_key=True, default=undashed_uuid)]
-created_col = Annotated[datetime.datetime, mapped_column(DateTime(timezone=True), server_default=func.now(), sort_order=1000)]
-modified_col = Annotated[datetime.datetime, mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=utcnow, sort_order=1001)]
+uuid7pk = Annotated[str, mapped_column(primary_key=True, default=undashed_uuid7)]
+ulidpk = Annotated[str, mapped_column(primary_key=True, default=ulid)]
+created_col = Annotated[datetime.datetime, mapped_column(DateTime(timezone=True), server_default=func.now(), index=True, sort_order=1000)]
+modified_col = Annotated[datetime.datetime, mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=utcnow, index=True, sort_order=1001)]
 
 
 class SerialPK_Mixin:
@@ -43,9 +129,26 @@ class UUIDPK_Mixin:
     uuid = mapped_column(String, primary_key=True, default=undashed_uuid, sort_order=-999)
 
 
+class UUID7PK_Mixin:
+    uuid = mapped_column(String, primary_key=True, default=undashed_uuid7, sort_order=-999)
+
+
+class ULIDPK_Mixin:
+    uuid = mapped_column(String, primary_key=True, default=ulid, sort_order=-999)
+
+
 class TimestampMixin:
     created: Mapped[created_col]
     modified: Mapped[modified_col]
 
 
 
+
+
+class QueueItemMixin:
+    """Columns used by workqueue.WorkQueue to claim rows."""
+    # server defaults too, so rows inserted with Core, raw SQL or by other services are claimable
+    status = mapped_column(String, default="new", server_default="new", nullable=False, index=True, sort_order=900)
+    claimed_by = mapped_column(String, nullable=True, sort_order=901)
+    claimed_at = mapped_column(DateTime(timezone=True), nullable=True, sort_order=902)
+    attempts = mapped_column(Integer, default=0, server_default="0", nullable=False, sort_order=903)
@@ -0,0 +1,141 @@
+import asyncio
+import datetime
+import logging
+import re
+
+from sqlalchemy import delete, select, text
+
+from .cycler import AsyncCycler
+from .repobase import RepoBase
+from .repomixins import utcnow
+
+
+
+logger = logging.getLogger(__name__)
+
+# dialects whose DELETE takes a LIMIT directly; elsewhere the batch is picked by a primary key subquery
+DELETE_LIMIT_DIALECTS = ("mysql", "mariadb")
+
+# children of a table range-partitioned on exactly one plain column, :column
+_PG_PARTITIONS = text("""
+    SELECT cn.nspname, c.relname, pg_get_expr(c.relpartbound, c.oid)
+    FROM pg_partitioned_table pt
+    JOIN pg_class p ON p.oid = pt.partrelid
+    JOIN pg_namespace pn ON pn.oid = p.relnamespace
+    JOIN pg_attribute a ON a.attrelid = p.oid AND a.attnum = pt.partattrs[0]
+    JOIN pg_inherits i ON i.inhparent = p.oid
+    JOIN pg_class c ON c.oid = i.inhrelid
+    JOIN pg_namespace cn ON cn.oid = c.relnamespace
+    WHERE p.relname = :table AND pn.nspname = COALESCE(:schema, current_schema())
+      AND pt.partstrat = 'r' AND pt.partnatts = 1 AND a.attname = :column
+""")
+_PG_UPPER_BOUND = re.compile(r"TO \('([^']+)'\)")
+
+
+def _quote_ident(name):
+    return '"' + name.replace('"', '""') + '"'
+
+
+class Retention:
+    """
+    Keeps rows of entity_class (see repomixins.TimestampMixin) younger than max_age, judged by `column`.
+    
+    prune() deletes in batch_size chunks, each in its own short transaction, and stops after max_batches
+    so one call has bounded cost. With partitioned=True on PostgreSQL tables range-partitioned on `column`
+    alone, partitions whose upper bound is before the cutoff are dropped whole first.
+    """
+    
+    
+    def __init__(self, repo: RepoBase, entity_class, max_age, column="created", batch_size=1000, max_batches=None,
+                 partitioned=False):
+        self.repo = repo
+        self.entity_class = entity_class
+        self.max_age = max_age if isinstance(max_age, datetime.timedelta) else datetime.timedelta(seconds=max_age)
+        self.column = getattr(entity_class, column)
+        self.batch_size = batch_size
+        self.max_batches = max_batches
+        self.partitioned = partitioned
+        pk_columns = entity_class.__mapper__.primary_key
+        if len(pk_columns) != 1:
+            raise ValueError(f"{entity_class.__name__}: Retention needs a single-column primary key")
+        self.pk = getattr(entity_class, entity_class.__mapper__.get_property_by_column(pk_columns[0]).key)
+    
+    
+    def cutoff(self):
+        return utcnow() - self.max_age
+    
+    
+    def _delete_batch_stmt(self, cutoff, dialect):
+        e = self.entity_class
+        if dialect in DELETE_LIMIT_DIALECTS:
+            return delete(e).where(self.column < cutoff).with_dialect_options(mysql_limit=self.batch_size)
+        batch = select(self.pk).where(self.column < cutoff).limit(self.batch_size).scalar_subquery()
+        return delete(e).where(self.pk.in_(batch)).execution_options(synchronize_session=False)
+    
+    
+    async def drop_partitions(self, cutoff=None):
+        """
+        Drops PostgreSQL partitions that only hold rows older than cutoff; returns their qualified names.
+        Tables not range-partitioned on `column` alone are left alone.
+        """
+        cutoff = cutoff or self.cutoff()
+        table = self.entity_class.__table__
+        params = {"table": table.name, "schema": table.schema, "column": self.column.expression.name}
+        dropped = []
+        async with self.repo.asmk() as sess:
+            async with sess.begin():
+                for schema, name, bound in (await sess.execute(_PG_PARTITIONS, params)).all():
+                    match = _PG_UPPER_BOUND.search(bound or "")
+                    if match is None:
+                        continue  # DEFAULT or MAXVALUE partition
+                    try:
+                        upper = datetime.datetime.fromisoformat(match.group(1))
+                    except ValueError:
+                        logger.warning("%s.%s: unexpected partition bound %s, skipped", schema, name, bound)
+                        continue
+                    if upper.tzinfo is None:
+                        upper = upper.replace(tzinfo=datetime.UTC)
+                    if upper <= cutoff:
+                        qualified = f"{_quote_ident(schema)}.{_quote_ident(name)}"
+                        await sess.execute(text(f"DROP TABLE {qualified}"))
+                        dropped.append(qualified)
+        if dropped:
+            logger.info("%s: dropped partitions %s", table.name, dropped)
+        return dropped
+    
+    
+    async def prune(self, cutoff=None):
+        """Deletes rows older than cutoff (default now - max_age); returns the number of rows deleted."""
+        cutoff = cutoff or self.cutoff()
+        dialect = self.repo.db.dialect.name
+        if self.partitioned and dialect == "postgresql":
+            await self.drop_partitions(cutoff)
+        
+        stmt = self._delete_batch_stmt(cutoff, dialect)
+        total = 0
+        batches = 0
+        while self.max_batches is None or batches < self.max_batches:
+            async with self.repo.asmk() as sess:
+                async with sess.begin():
+                    deleted = (await sess.execute(stmt)).rowcount
+            total += deleted
+            batches += 1
+            if deleted < self.batch_size:
+                break
+            await asyncio.sleep(0)  # let other tasks use the connection pool between batches
+        if total:
+            logger.info("%s: pruned %s rows older than %s", self.entity_class.__name__, total, cutoff)
+        return total
+
+
+class RetentionCycler(AsyncCycler):
+    """AsyncCycler that runs retention.prune() every cycle; counts as work when rows were deleted."""
+    
+    
+    def __init__(self, name, retention: Retention, **cycler_kwargs):
+        super().__init__(name, **cycler_kwargs)
+        self.retention = retention
+    
+    
+    async def async_cycled_func(self):
+        return await self.retention.prune() > 0
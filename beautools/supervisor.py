@@ -0,0 +1,291 @@
+import asyncio
+import logging
+import multiprocessing
+import multiprocessing.connection
+import os
+import queue
+import sys
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+from .cycler import AsyncCycler, Cycler
+from .hot_cycler import HotAsyncCycler
+
+
+
+logger = logging.getLogger(__name__)
+
+SHARDINGS = ("static", "hash")
+
+
+def _start_cycler(cycler, loop, executor):
+    if isinstance(cycler, HotAsyncCycler):
+        return loop.create_task(cycler.loop1())
+    if isinstance(cycler, AsyncCycler):
+        return loop.create_task(cycler.run())
+    return loop.run_in_executor(executor, cycler.run)  # sync Cycler blocks in time.sleep, keep it off the loop
+
+
+class _Reporter:
+    """Sends reports from a thread, so a full pipe (parent not polling) never blocks the worker's loop."""
+    
+    
+    def __init__(self, conn):
+        self.conn = conn
+        self.latest = queue.Queue(maxsize=1)
+        threading.Thread(target=self._send_forever, name="beautools-reporter", daemon=True).start()
+    
+    
+    def put(self, report):
+        try:
+            self.latest.get_nowait()  # an unsent report is stale, replace it
+        except queue.Empty:
+            pass
+        self.latest.put_nowait(report)
+    
+    
+    def _send_forever(self):
+        while True:
+            self.conn.send(self.latest.get())
+
+
+def _report(index, cyclers, tasks):
+    times = os.times()
+    return {
+            "worker": index,
+            "pid": os.getpid(),
+            "time": time.time(),
+            "cyclers": {c.name: not t.done() for c, t in zip(cyclers, tasks)},
+            "cpu": times.user + times.system,
+    }
+
+
+async def _worker(index, cyclers, conn, report_interval):
+    loop = asyncio.get_running_loop()
+    n_sync = sum(not isinstance(c, (AsyncCycler, HotAsyncCycler)) for c in cyclers)
+    # one thread per sync cycler, the default executor would run only min(32, cpu + 4) of them
+    executor = ThreadPoolExecutor(n_sync, thread_name_prefix="beautools-cycler") if n_sync else None
+    tasks = [_start_cycler(c, loop, executor) for c in cyclers]
+    reporter = _Reporter(conn)
+    while True:
+        reporter.put(_report(index, cyclers, tasks))
+        done, _ = await asyncio.wait(tasks, timeout=report_interval, return_when=asyncio.FIRST_COMPLETED)
+        for cycler, task in zip(cyclers, tasks):
+            if task in done:
+                task.result()
+                raise RuntimeError(f"{cycler.name}: cycler returned, cyclers are expected to run forever")
+
+
+def _worker_main(index, cyclers, conn, report_interval):
+    try:
+        asyncio.run(_worker(index, cyclers, conn, report_interval))
+    except BaseException:
+        logger.exception("worker %s failed", index)
+    sys.stderr.flush()
+    os._exit(1)  # do not wait for sync cycler threads, they never return
+
+
+class _Slot:
+    def __init__(self, index):
+        self.index = index
+        self.cyclers = []
+        self.process = None
+        self.conn = None
+        self.started_at = None
+        self.restart_at = None
+        self.restarts = 0
+        self.failures = 0
+        self.last_report = None
+        self.last_seen = None
+
+
+class Supervisor:
+    """
+    Runs registered cyclers in `workers` processes, so cycler work is not capped by one GIL.
+    
+    Cyclers are assigned round-robin or to an explicit worker ("static"), or by a stable hash of
+    their name ("hash"). A dead worker is restarted with exponential backoff; workers send a
+    health report over a pipe every report_interval seconds, see health(). A worker whose last report
+    is older than stale_after seconds (default 3 * report_interval) is killed and restarted by poll().
+    """
+    
+    
+    def __init__(self, workers=None, sharding="static", backoff=1, max_backoff=60, report_interval=5, stale_after=None,
+                 mp_context=None):
+        if sharding not in SHARDINGS:
+            raise ValueError(f"sharding must be one of {SHARDINGS}, not {sharding!r}")
+        self.slots = [_Slot(i) for i in range(workers or os.cpu_count() or 1)]
+        self.sharding = sharding
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.report_interval = report_interval
+        self.stale_after = stale_after or 3 * report_interval
+        self.ctx = multiprocessing.get_context(mp_context)
+        self._next = 0
+        self._running = False
+    
+    
+    def register(self, cycler, worker=None):
+        """Assigns cycler to a worker and returns the worker index."""
+        if not isinstance(cycler, (Cycler, AsyncCycler, HotAsyncCycler)):
+            raise TypeError(f"expected a Cycler, AsyncCycler or HotAsyncCycler, got {type(cycler).__name__}")
+        if self._running:
+            raise RuntimeError("register cyclers before start()")
+        if worker is None and self.sharding == "hash":
+            worker = zlib.crc32(cycler.name.encode()) % len(self.slots)
+        elif worker is None:
+            worker = self._next % len(self.slots)
+            self._next += 1
+        self.slots[worker].cyclers.append(cycler)
+        return worker
+    
+    
+    def assignments(self):
+        return [[c.name for c in slot.cyclers] for slot in self.slots]
+    
+    
+    def _spawn(self, slot):
+        reader, writer = self.ctx.Pipe(duplex=False)
+        slot.process = self.ctx.Process(target=_worker_main, args=(slot.index, slot.cyclers, writer, self.report_interval),
+                name=f"beautools-worker-{slot.index}", daemon=True)
+        slot.process.start()
+        writer.close()
+        slot.conn = reader
+        slot.started_at = time.monotonic()
+        slot.restart_at = None
+        slot.last_report = None
+        slot.last_seen = None
+        logger.info("worker %s started, pid %s, cyclers %s", slot.index, slot.process.pid, [c.name for c in slot.cyclers])
+    
+    
+    def _on_exit(self, slot):
+        uptime = time.monotonic() - slot.started_at
+        slot.failures = 1 if uptime >= self.max_backoff else slot.failures + 1
+        delay = min(self.backoff * 2 ** (slot.failures - 1), self.max_backoff)
+        logger.error("worker %s (pid %s) exited with %s after %.1fs, restarting in %.1fs",
+                slot.index, slot.process.pid, slot.process.exitcode, uptime, delay)
+        slot.process.join()
+        if slot.conn is not None:
+            slot.conn.close()
+            slot.conn = None
+        slot.process = None
+        slot.restart_at = time.monotonic() + delay
+    
+    
+    def _is_stale(self, slot, now):
+        return now - (slot.last_seen or slot.started_at) > self.stale_after
+    
+    
+    def start(self):
+        self._running = True
+        for slot in self.slots:
+            if slot.cyclers:
+                self._spawn(slot)
+        return self
+    
+    
+    def poll(self, timeout=1.0):
+        """One supervision step: collects reports, notices dead workers and restarts those whose backoff passed."""
+        now = time.monotonic()
+        for slot in self.slots:
+            if slot.restart_at is not None and slot.restart_at <= now:
+                slot.restarts += 1
+                self._spawn(slot)
+        
+        pending = [slot.restart_at - now for slot in self.slots if slot.restart_at is not None]
+        if pending:
+            timeout = max(0, min(timeout, *pending))
+        by_handle = {}
+        for slot in self.slots:
+            if slot.conn is not None:
+                by_handle[slot.conn] = slot
+            if slot.process is not None:
+                by_handle[slot.process.sentinel] = slot
+        if not by_handle:
+            time.sleep(timeout)
+            return
+        
+        ready = multiprocessing.connection.wait(list(by_handle), timeout)
+        for handle in ready:
+            slot = by_handle[handle]
+            if handle is slot.conn:
+                try:
+                    while slot.conn.poll():
+                        slot.last_report = slot.conn.recv()
+                        slot.last_seen = time.monotonic()
+                except (EOFError, OSError):
+                    slot.conn.close()
+                    slot.conn = None
+        for handle in ready:
+            slot = by_handle[handle]
+            if slot.process is not None and handle == slot.process.sentinel:
+                self._on_exit(slot)
+        now = time.monotonic()
+        for slot in self.slots:
+            if slot.process is not None and self._is_stale(slot, now):
+                logger.error("worker %s (pid %s) sent no report for %.1fs, killing it", slot.index, slot.process.pid,
+                        now - (slot.last_seen or slot.started_at))
+                slot.process.kill()  # its sentinel fires and the next poll() restarts it
+    
+    
+    def run(self, poll_interval=1.0):
+        """Blocks supervising workers until stop()."""
+        if not self._running:
+            self.start()
+        try:
+            while self._running:
+                self.poll(poll_interval)
+        finally:
+            self.stop()
+    
+    
+    def stop(self, timeout=5):
+        self._running = False
+        for slot in self.slots:
+            if slot.process is not None:
+                slot.process.terminate()
+        for slot in self.slots:
+            if slot.process is not None:
+                slot.process.join(timeout)
+                if slot.process.is_alive():
+                    slot.process.kill()
+                    slot.process.join()
+                slot.process = None
+            if slot.conn is not None:
+                slot.conn.close()
+                slot.conn = None
+            slot.restart_at = None
+    
+    
+    def health(self):
+        """
+        Per-worker liveness, restart count and the last report: cycler task states, cpu seconds, report age.
+        healthy means alive, reporting within stale_after and every cycler task still running.
+        """
+        now = time.time()
+        result = []
+        for slot in self.slots:
+            report = slot.last_report
+            alive = slot.process is not None and slot.process.is_alive()
+            result.append({
+                    "worker": slot.index,
+                    "alive": alive,
+                    "healthy": alive and report is not None and not self._is_stale(slot, time.monotonic())
+                               and all(report["cyclers"].values()),
+                    "pid": slot.process.pid if slot.process is not None else None,
+                    "restarts": slot.restarts,
+                    "cyclers": report["cyclers"] if report else dict.fromkeys((c.name for c in slot.cyclers), False),
+                    "cpu": report["cpu"] if report else None,
+                    "report_age": now - report["time"] if report else None,
+            })
+        return result
+    
+    
+    def __enter__(self):
+        return self.start()
+    
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
@@ -1,3 +1,16 @@
+import asyncio
+import collections
+import contextlib
+import datetime
+import inspect
+import selectors
+import time
+
+
+
+_real_asyncio_sleep = asyncio.sleep
+
+
 def tracking_setattr(monkeypatch, history_list, cls, attr_name):
     original_setter = cls.__setattr__
     
@@ -24,3 +37,256 @@ class AttrSpy:
     
     def __get__(self, instance, owner):
         return self.value
+
+
+class AttrTrace:
+    """Bounded write history of one attribute of one instance; entries are values or (perf_counter, value)."""
+    
+    
+    def __init__(self, maxlen, timestamps):
+        self.history = collections.deque(maxlen=maxlen)
+        self.timestamps = timestamps
+    
+    
+    def record(self, value):
+        self.history.append((time.perf_counter(), value) if self.timestamps else value)
+    
+    
+    @property
+    def values(self):
+        return [entry[1] for entry in self.history] if self.timestamps else list(self.history)
+    
+    
+    def clear(self):
+        self.history.clear()
+
+
+class _TracedAttr:
+    def __init__(self, name):
+        self.name = name
+        self.trace_key = f"__trace_{name}"
+    
+    
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        try:
+            return instance.__dict__[self.name]
+        except KeyError:
+            raise AttributeError(self.name) from None
+    
+    
+    def __set__(self, instance, value):
+        instance.__dict__[self.name] = value
+        instance.__dict__[self.trace_key].record(value)
+    
+    
+    def __delete__(self, instance):
+        del instance.__dict__[self.name]
+
+
+_traced_classes = {}
+
+
+def _traced_class(base, names):
+    key = (base, frozenset(names))
+    if key not in _traced_classes:
+        attrs = {name: _TracedAttr(name) for name in names}
+        attrs["_traced_base"] = base
+        _traced_classes[key] = type(base.__name__, (base,), attrs)
+    return _traced_classes[key]
+
+
+def trace_attr(obj, attr_name, maxlen=1000, timestamps=False, monkeypatch=None):
+    """
+    Records writes of obj.attr_name into a ring buffer of maxlen entries and returns its AttrTrace.
+    
+    Only this instance is affected: it is switched to a cached subclass carrying a descriptor for the
+    traced attributes, so other attributes and other instances run at full speed. The current value,
+    if any, is the first history entry. With monkeypatch the class switch is undone at teardown.
+    """
+    base = getattr(type(obj), "_traced_base", type(obj))
+    if inspect.isdatadescriptor(inspect.getattr_static(base, attr_name, None)):
+        raise TypeError(f"Cannot trace {base.__name__}.{attr_name}: it is a property or another data descriptor")
+    names = {n for n, v in vars(type(obj)).items() if isinstance(v, _TracedAttr)} | {attr_name}
+    try:
+        traced_cls = _traced_class(base, names)
+    except TypeError as e:
+        raise TypeError(f"Cannot trace attributes of {base.__name__} instances: {e}") from e
+    
+    trace = AttrTrace(maxlen, timestamps)
+    if attr_name in obj.__dict__:
+        trace.record(obj.__dict__[attr_name])
+    if monkeypatch is not None:
+        monkeypatch.setitem(obj.__dict__, f"__trace_{attr_name}", trace)
+        monkeypatch.setattr(obj, "__class__", traced_cls)
+    else:
+        obj.__dict__[f"__trace_{attr_name}"] = trace
+        obj.__class__ = traced_cls
+    return trace
+
+
+def untrace_attr(obj, attr_name):
+    base = getattr(type(obj), "_traced_base", None)
+    if base is None:
+        return
+    names = {n for n, v in vars(type(obj)).items() if isinstance(v, _TracedAttr)} - {attr_name}
+    obj.__dict__.pop(f"__trace_{attr_name}", None)
+    obj.__class__ = _traced_class(base, names) if names else base
+
+
+class VirtualTimeout(BaseException):
+    """Raised by VirtualClock.sleep when run_sync's virtual deadline is reached (BaseException, so cyclers do not swallow it)."""
+
+
+class _ModuleProxy:
+    def __init__(self, module, **overrides):
+        self._module = module
+        self.__dict__.update(overrides)
+    
+    
+    def __getattr__(self, name):
+        return getattr(self._module, name)
+
+
+class _VirtualSelector:
+    # instead of blocking until the next timer, jump the clock to it
+    def __init__(self, clock):
+        self._clock = clock
+        self._selector = selectors.DefaultSelector()
+    
+    
+    def select(self, timeout=None):
+        events = self._selector.select(0)
+        if events:
+            return events
+        if timeout is None:
+            return self._selector.select(None)  # nothing scheduled, only real I/O can wake us
+        self._clock.advance(timeout)
+        return []
+    
+    
+    def __getattr__(self, name):
+        return getattr(self._selector, name)
+
+
+class _VirtualTimeLoop(asyncio.SelectorEventLoop):
+    def __init__(self, clock):
+        super().__init__(_VirtualSelector(clock))
+        self._virtual_clock = clock
+    
+    
+    def time(self):
+        return self._virtual_clock.elapsed
+
+
+class VirtualClock:
+    """
+    Fake time for Cycler, AsyncCycler and HotAsyncCycler: a day of cycles runs in seconds of real time.
+        
+        clock = VirtualClock(datetime.datetime(2025, 4, 28, 9, 0))
+        with clock.patch():
+            clock.run(HotAsyncCycler("c", func).loop1(), for_seconds=24 * 3600)
+        assert clock.sleeps[0] == (datetime.datetime(2025, 4, 28, 9, 0), 1)
+    
+    Every sleep of a cycler is recorded in clock.sleeps as (virtual now, seconds).
+    """
+    
+    
+    def __init__(self, start=datetime.datetime(2025, 1, 1)):
+        self.start = start
+        self.elapsed = 0.0
+        self.sleeps = []
+        self._deadline = None
+    
+    
+    def now(self):
+        return self.start + datetime.timedelta(seconds=self.elapsed)
+    
+    
+    def time(self):
+        return self.start.timestamp() + self.elapsed
+    
+    
+    def monotonic(self):
+        return self.elapsed
+    
+    
+    def advance(self, seconds):
+        self.elapsed += seconds
+    
+    
+    def sleep(self, seconds):
+        if self._deadline is not None and self.elapsed + seconds > self._deadline:
+            self.elapsed = self._deadline
+            raise VirtualTimeout()
+        self.sleeps.append((self.now(), seconds))
+        self.advance(seconds)
+    
+    
+    async def asleep(self, seconds, result=None):
+        self.sleeps.append((self.now(), seconds))
+        return await _real_asyncio_sleep(seconds, result)
+    
+    
+    def new_event_loop(self):
+        return _VirtualTimeLoop(self)
+    
+    
+    def run(self, coro, for_seconds=None):
+        """Runs coro on a virtual-time loop; with for_seconds a never-ending loop is cancelled after that virtual time."""
+        loop = self.new_event_loop()
+        try:
+            if for_seconds is None:
+                return loop.run_until_complete(coro)
+            task = loop.create_task(coro)
+            loop.run_until_complete(asyncio.wait([task], timeout=for_seconds))
+            if not task.done():
+                task.cancel()
+                loop.run_until_complete(asyncio.gather(task, return_exceptions=True))
+                return None
+            return task.result()
+        finally:
+            loop.close()
+    
+    
+    def run_sync(self, func, for_seconds):
+        """Calls a blocking loop like Cycler.run until for_seconds of virtual time have passed."""
+        self._deadline = self.elapsed + for_seconds
+        try:
+            return func()
+        except VirtualTimeout:
+            return None
+        finally:
+            self._deadline = None
+    
+    
+    @contextlib.contextmanager
+    def patch(self):
+        """Points time/asyncio/datetime used by the cycler modules to this clock."""
+        from . import cycler, hot_cycler
+        
+        clock = self
+        
+        
+        class VirtualDatetime(datetime.datetime):
+            @classmethod
+            def now(cls, tz=None):
+                now = clock.now()
+                return now if tz is None else now.replace(tzinfo=tz)
+        
+        
+        replacements = [
+                (cycler, "time", _ModuleProxy(time, sleep=self.sleep, time=self.time, monotonic=self.monotonic)),
+                (cycler, "asyncio", _ModuleProxy(asyncio, sleep=self.asleep)),
+                (hot_cycler, "asyncio", _ModuleProxy(asyncio, sleep=self.asleep)),
+                (hot_cycler, "datetime", _ModuleProxy(datetime, datetime=VirtualDatetime)),
+        ]
+        originals = [(module, name, getattr(module, name)) for module, name, _ in replacements]
+        for module, name, value in replacements:
+            setattr(module, name, value)
+        try:
+            yield self
+        finally:
+            for module, name, value in originals:
+                setattr(module, name, value)
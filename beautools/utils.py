@@ -1,4 +1,5 @@
 import asyncio
+import operator
 
 from datetime import datetime, time, timedelta
 
@@ -30,6 +31,25 @@ def map_many(iterable, function, *other):
     return map(function, iterable)
 
 
+class _Chain:
+    # picklable counterpart of applyer, so chains can be sent to worker processes
+    def __init__(self, funcs):
+        self.funcs = funcs
+    
+    
+    def __call__(self, x):
+        for func in self.funcs:
+            x = func(x)
+        return x
+
+
+def pmap_many(iterable, function, *other, **pmap_kwargs):
+    """map_many over a pool, see funcs.pmapl for pmap_kwargs. The chain runs fused per element in the workers."""
+    from .funcs import pmapl
+    
+    return iter(pmapl(_Chain((function,) + other), iterable, **pmap_kwargs))
+
+
 def applyer(*funcs):
     def _applyer(x):
         for func in funcs:
@@ -57,26 +77,102 @@ def reverse_dict(d):
     return {k: v[0] if len(v) == 1 else v for k, v in reversed_d.items()}
 
 
-def merge(D1s: dict, *D2s: dict):
-    def merge_two(D1: dict, D2: dict):
-        for key, value in D1.items():
-            if key in D2:
-                if type(value) is dict:
-                    merge(D1[key], D2[key])
+def _append(old, new):
+    if type(old) is not list:
+        old = [old]
+    if type(new) is list:
+        old.extend(new)
+    else:
+        old.append(new)
+    return old
+
+
+MERGE_STRATEGIES = {
+        "append": _append,
+        "overwrite": lambda old, new: new,
+        "sum": operator.add,
+}
+
+
+def _merge_reducer(strategy):
+    if callable(strategy):
+        return strategy
+    if strategy not in MERGE_STRATEGIES:
+        raise ValueError(f"Unknown merge strategy {strategy!r}, expected one of {list(MERGE_STRATEGIES)} or a callable")
+    return MERGE_STRATEGIES[strategy]
+
+
+_MISSING = object()
+
+
+def _merge_plain(stack, reduce):
+    # hot path of merge_many without per-path reducers: no path tuples, append inlined
+    is_append = reduce is _append
+    while stack:
+        dst, src, _ = stack.pop()
+        for key, new in src.items():
+            old = dst.get(key, _MISSING)
+            if old is _MISSING:
+                if is_append:
+                    dst[key] = [new]
+                elif isinstance(new, dict):
+                    dst[key] = child = type(new)()
+                    stack.append((child, new, None))
                 else:
-                    if type(value) in (int, float, str):
-                        D1[key] = [value]
-                    if type(D2[key]) is list:
-                        D1[key].extend(D2[key])
-                    else:
-                        D1[key].append(D2[key])
-        for key, value in D2.items():
-            if key not in D1:
-                D1[key] = [value]
-    
+                    dst[key] = new
+            elif isinstance(old, dict) and isinstance(new, dict):
+                stack.append((old, new, None))
+            elif not is_append:
+                dst[key] = reduce(old, new)
+            elif type(old) is list:
+                if type(new) is list:
+                    old.extend(new)
+                else:
+                    old.append(new)
+            else:
+                dst[key] = [old, *new] if type(new) is list else [old, new]
+
+
+def merge_many(target: dict, sources, strategy="append", reducers=None):
+    """
+    Merges every dict of sources into target in place and returns target. Nested dicts are
+    merged with an explicit stack, so depth is not limited by the recursion limit.
     
-    for D2n in D2s:
-        merge_two(D1s, D2n)
+    strategy decides what happens to a key present in both dicts (unless both values are dicts):
+    "append" collects values into lists (the behaviour of merge), "overwrite", "sum" or reducer(old, new).
+    reducers maps key paths (tuples) to a strategy for that path; it is applied as is, even to dicts.
+    """
+    default = _merge_reducer(strategy)
+    by_path = {tuple(p): _merge_reducer(r) for p, r in reducers.items()} if reducers else None
+    stack = [(target, source, ()) for source in reversed(list(sources))]  # sources may be a generator
+    if by_path is None:
+        _merge_plain(stack, default)
+        return target
+    while stack:
+        dst, src, path = stack.pop()
+        for key, new in src.items():
+            key_path = path + (key,)
+            custom = key_path in by_path
+            reduce = by_path[key_path] if custom else default
+            if key in dst:
+                old = dst[key]
+                if not custom and isinstance(old, dict) and isinstance(new, dict):
+                    stack.append((old, new, key_path))
+                else:
+                    dst[key] = reduce(old, new)
+            elif reduce is _append:
+                dst[key] = [new]
+            elif not custom and isinstance(new, dict):
+                # copy instead of aliasing, later merges must not mutate the source
+                dst[key] = child = type(new)()
+                stack.append((child, new, key_path))
+            else:
+                dst[key] = new
+    return target
+
+
+def merge(D1s: dict, *D2s: dict):
+    merge_many(D1s, D2s)
 
 
 async def to_async(func, *args, **kwargs):
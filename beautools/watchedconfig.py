@@ -0,0 +1,193 @@
+import asyncio
+import ctypes
+import ctypes.util
+import logging
+import os
+import struct
+import sys
+
+from .yamlfile import YamlFile, _stat_stamp
+
+
+
+logger = logging.getLogger(__name__)
+
+
+class _Inotify:
+    IN_MODIFY = 0x002
+    IN_CLOSE_WRITE = 0x008
+    IN_MOVED_TO = 0x080
+    IN_CREATE = 0x100
+    _EVENT = struct.Struct("iIII")
+    
+    
+    def __init__(self, dirpath):
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        # the directory is watched, not the file: atomic saves replace the file's inode
+        mask = self.IN_MODIFY | self.IN_CLOSE_WRITE | self.IN_MOVED_TO | self.IN_CREATE
+        if libc.inotify_add_watch(self.fd, os.fsencode(dirpath), mask) < 0:
+            errno = ctypes.get_errno()
+            os.close(self.fd)
+            raise OSError(errno, f"inotify_add_watch failed for {dirpath}")
+    
+    
+    def read_names(self):
+        try:
+            buf = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+        names = []
+        i = 0
+        while i < len(buf):
+            _wd, _mask, _cookie, length = self._EVENT.unpack_from(buf, i)
+            i += self._EVENT.size
+            names.append(os.fsdecode(buf[i:i + length].rstrip(b"\0")))
+            i += length
+        return names
+    
+    
+    def close(self):
+        os.close(self.fd)
+    
+    
+    @classmethod
+    def open(cls, dirpath):
+        if not sys.platform.startswith("linux"):
+            return None
+        try:
+            return cls(dirpath)
+        except (OSError, AttributeError) as e:
+            logger.warning("inotify unavailable, falling back to polling: %s", e)
+            return None
+
+
+class WatchedConfig:
+    """
+    YAML config that reloads itself when the file changes.
+    
+    Readers use .d (or item access) and always see a complete dict: a reload parses into
+    a new object and swaps the reference. Subscribers are notified only when the content changed.
+    """
+    
+    
+    def __init__(self, path, debounce=0.1, poll_interval=1, force_polling=False):
+        self.yamlfile = YamlFile(path, track_changes=True)
+        self.yamlfile.read()
+        self.d = self.yamlfile.d
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self.force_polling = force_polling
+        self._callbacks = []
+        self._queues = []
+    
+    
+    def __getitem__(self, key):
+        return self.d[key]
+    
+    
+    def get(self, key, default=None):
+        return self.d.get(key, default)
+    
+    
+    def subscribe(self, callback):
+        """callback(new_d) is called from the event loop after every effective reload."""
+        self._callbacks.append(callback)
+        return callback
+    
+    
+    def subscribe_queue(self, maxsize=1):
+        """Returns an asyncio.Queue receiving new configs; when full, the oldest pending config is dropped."""
+        queue = asyncio.Queue(maxsize)
+        self._queues.append(queue)
+        return queue
+    
+    
+    def unsubscribe(self, callback_or_queue):
+        for subscribers in (self._callbacks, self._queues):
+            if callback_or_queue in subscribers:
+                subscribers.remove(callback_or_queue)
+    
+    
+    def reload(self):
+        return self._apply(self._read())
+    
+    
+    async def areload(self):
+        return self._apply(await asyncio.to_thread(self._read))
+    
+    
+    def _read(self):
+        try:
+            return self.yamlfile.read()
+        except Exception as e:
+            logger.error("%s: reload failed, keeping previous config: %s", self.yamlfile.filepath, e)
+            return False
+    
+    
+    def _apply(self, was_read):
+        if not was_read or self.yamlfile.d == self.d:
+            return False
+        self.d = self.yamlfile.d
+        self._notify(self.d)
+        return True
+    
+    
+    def _notify(self, new_d):
+        logger.info("%s: config reloaded", self.yamlfile.filepath)
+        for callback in list(self._callbacks):
+            try:
+                callback(new_d)
+            except Exception as e:
+                logger.error("%s: subscriber %r failed: %s", self.yamlfile.filepath, callback, e)
+        for queue in self._queues:
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(new_d)
+    
+    
+    async def run(self):
+        """Watches the file until cancelled."""
+        path = os.path.abspath(self.yamlfile.filepath)
+        dirpath, filename = os.path.split(path)
+        inotify = None if self.force_polling else _Inotify.open(dirpath)
+        if inotify is None:
+            return await self._run_polling(path)
+        
+        loop = asyncio.get_running_loop()
+        changed = asyncio.Event()
+        
+        
+        def on_readable():
+            if filename in inotify.read_names():
+                changed.set()
+        
+        
+        loop.add_reader(inotify.fd, on_readable)
+        try:
+            while True:
+                await changed.wait()
+                # debounce: wait until writes stop arriving
+                while changed.is_set():
+                    changed.clear()
+                    await asyncio.sleep(self.debounce)
+                await self.areload()
+        finally:
+            loop.remove_reader(inotify.fd)
+            inotify.close()
+    
+    
+    async def _run_polling(self, path):
+        stamp = _stat_stamp(path)
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            new_stamp = _stat_stamp(path)
+            if new_stamp == stamp:
+                continue
+            while new_stamp != stamp:
+                stamp = new_stamp
+                await asyncio.sleep(self.debounce)
+                new_stamp = _stat_stamp(path)
+            await self.areload()
@@ -0,0 +1,142 @@
+import datetime
+import logging
+
+from sqlalchemy import case, select, update
+
+from .cycler import AsyncCycler
+from .repobase import RepoBase
+from .repomixins import undashed_uuid, utcnow
+
+
+
+logger = logging.getLogger(__name__)
+
+# dialects that implement SELECT ... FOR UPDATE SKIP LOCKED
+SKIP_LOCKED_DIALECTS = ("postgresql", "mysql", "mariadb", "oracle")
+
+
+class WorkQueue:
+    """
+    Queue over a table of entity_class rows (see repomixins.QueueItemMixin), safe with many consumers.
+    
+    claim() moves up to batch_size "new" rows to "claimed" under a unique claim token. On dialects with
+    SKIP LOCKED concurrent consumers skip each other's rows instead of waiting; elsewhere (SQLite) the
+    claim is one atomic UPDATE. Claimed rows not acked within visibility_timeout seconds go back to "new".
+    ack()/release() only touch rows still held under the items' claim token, so a consumer whose claim
+    expired cannot finish rows another consumer has claimed since. With max_attempts, rows released or
+    expired after that many claims go to "failed" instead of back to "new".
+    """
+    NEW = "new"
+    CLAIMED = "claimed"
+    DONE = "done"
+    FAILED = "failed"
+    
+    
+    def __init__(self, repo: RepoBase, entity_class, batch_size=100, visibility_timeout=5 * 60, max_attempts=None):
+        self.repo = repo
+        self.entity_class = entity_class
+        self.batch_size = batch_size
+        self.visibility_timeout = visibility_timeout
+        self.max_attempts = max_attempts
+        pk_columns = entity_class.__mapper__.primary_key
+        if len(pk_columns) != 1:
+            raise ValueError(f"{entity_class.__name__}: WorkQueue needs a single-column primary key")
+        self.pk = getattr(entity_class, entity_class.__mapper__.get_property_by_column(pk_columns[0]).key)
+        self.skip_locked = repo.db.dialect.name in SKIP_LOCKED_DIALECTS
+    
+    
+    async def claim(self, n=None):
+        n = n or self.batch_size
+        e = self.entity_class
+        token = undashed_uuid()
+        claim_values = dict(status=self.CLAIMED, claimed_by=token, claimed_at=utcnow(), attempts=e.attempts + 1)
+        candidates = select(self.pk).where(e.status == self.NEW).order_by(self.pk).limit(n)
+        async with self.repo.asmk() as sess:
+            async with sess.begin():
+                if self.skip_locked:
+                    ids = (await sess.execute(candidates.with_for_update(skip_locked=True))).scalars().all()
+                    if not ids:
+                        return []
+                    await sess.execute(update(e).where(self.pk.in_(ids)).values(**claim_values))
+                else:
+                    # a single UPDATE is atomic on SQLite, the database is locked for its duration
+                    await sess.execute(update(e).where(self.pk.in_(candidates.scalar_subquery())).values(**claim_values))
+            execres = await sess.execute(select(e).where(e.claimed_by == token).order_by(self.pk))
+            return execres.scalars().all()
+    
+    
+    def _retry_status(self):
+        """Status for a claimed row going back to the queue: "new", or "failed" once attempts are used up."""
+        if self.max_attempts is None:
+            return self.NEW
+        return case((self.entity_class.attempts >= self.max_attempts, self.FAILED), else_=self.NEW)
+    
+    
+    async def _set_status(self, items, status):
+        by_token = {}
+        for item in items:
+            if item.claimed_by is not None:  # items not claimed through this queue are ignored
+                by_token.setdefault(item.claimed_by, []).append(getattr(item, self.pk.key))
+        if not by_token:
+            return 0
+        e = self.entity_class
+        updated = 0
+        async with self.repo.asmk() as sess:
+            async with sess.begin():
+                for token, ids in by_token.items():
+                    stmt = (update(e)
+                            .where(self.pk.in_(ids), e.status == self.CLAIMED, e.claimed_by == token)
+                            .values(status=status, claimed_by=None, claimed_at=None))
+                    updated += (await sess.execute(stmt)).rowcount
+        return updated
+    
+    
+    async def ack(self, items):
+        """Marks claimed items done with one UPDATE per claim; returns the number of rows updated."""
+        return await self._set_status(items, self.DONE)
+    
+    
+    async def release(self, items):
+        """Returns claimed items to the queue at once, e.g. after a failed handler (see max_attempts)."""
+        return await self._set_status(items, self._retry_status())
+    
+    
+    async def requeue_expired(self):
+        e = self.entity_class
+        cutoff = utcnow() - datetime.timedelta(seconds=self.visibility_timeout)
+        stmt = (update(e)
+                .where(e.status == self.CLAIMED, e.claimed_at < cutoff)
+                .values(status=self._retry_status(), claimed_by=None, claimed_at=None))
+        async with self.repo.asmk() as sess:
+            async with sess.begin():
+                requeued = (await sess.execute(stmt)).rowcount
+        if requeued:
+            logger.warning("%s: %s claimed items passed the visibility timeout, requeued", e.__name__, requeued)
+        return requeued
+
+
+class QueueConsumer(AsyncCycler):
+    """
+    AsyncCycler whose cycle claims a batch from queue, awaits handler(items) and acks the batch.
+    If the handler raises, the batch is released and the cycler backs off with ERROR_SLEEP.
+    """
+    
+    
+    def __init__(self, name, queue: WorkQueue, handler, **cycler_kwargs):
+        super().__init__(name, **cycler_kwargs)
+        self.queue = queue
+        self.handler = handler
+    
+    
+    async def async_cycled_func(self):
+        await self.queue.requeue_expired()
+        items = await self.queue.claim()
+        if not items:
+            return False
+        try:
+            await self.handler(items)
+        except Exception:
+            await self.queue.release(items)
+            raise
+        await self.queue.ack(items)
+        return True
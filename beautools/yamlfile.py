@@ -1,22 +1,101 @@
+import asyncio
+import copy
+import os
+
 import yaml
 import yamlordereddictloader
 
 
 
+# yamlordereddictloader only ships pure-python Loader/Dumper, same thing on top of libyaml when available
+class OrderedLoader(getattr(yaml, "CLoader", yaml.Loader)):
+    construct_yaml_map = yamlordereddictloader.construct_yaml_map
+    construct_mapping = yamlordereddictloader.construct_mapping
+
+
+OrderedLoader.add_constructor('tag:yaml.org,2002:map', OrderedLoader.construct_yaml_map)
+OrderedLoader.add_constructor('tag:yaml.org,2002:omap', OrderedLoader.construct_yaml_map)
+
+
+class OrderedDumper(getattr(yaml, "CDumper", yaml.Dumper)):
+    represent_ordereddict = yamlordereddictloader.represent_ordereddict
+
+
+OrderedDumper.add_representer(yamlordereddictloader.OrderedDict, OrderedDumper.represent_ordereddict)
+
+
+def _stat_stamp(path):
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
 class YamlFile:
     
-    def __init__(self, path):
+    def __init__(self, path, track_changes=False):
+        """
+        With track_changes=True read() is skipped while the file's mtime/size are unchanged
+        and self.d was not modified, and save() is skipped while self.d equals what was last read or saved.
+        """
         self.filepath = path
         self.d = None
+        self.track_changes = track_changes
+        self._stamp = None
+        self._snapshot = None
+    
+    
+    def is_dirty(self):
+        return not self.track_changes or self.d != self._snapshot
     
     
-    def read(self):
+    def read(self, force=False):
+        if not force and self.track_changes and self._stamp is not None \
+                and _stat_stamp(self.filepath) == self._stamp and not self.is_dirty():
+            return False
+        
         with open(self.filepath, 'r', encoding="utf-8") as file:
-            self.d = yaml.load(file, yamlordereddictloader.Loader)
+            self._stamp = _stat_stamp(self.filepath)
+            self.d = yaml.load(file, OrderedLoader)
         # new_dict = OrderedDict(list({'id': i}.items()) + list(q.items()))
+        self._remember()
+        return True
     
     
-    def save(self):
-        with open(self.filepath, 'w', encoding="utf-8") as file:
-            yaml.dump(self.d, file, yamlordereddictloader.Dumper, allow_unicode=True, sort_keys=False)
-
+    def save(self, force=False):
+        if not force and not self.is_dirty():
+            return False
+        
+        dirname = os.path.dirname(os.path.abspath(self.filepath))
+        tmp_path = os.path.join(dirname, f".tmp-{os.urandom(8).hex()}.yaml")
+        # 0666 like a plain open(), so a new file gets the umask mode without reading the process-wide umask
+        fd = os.open(tmp_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666)
+        try:
+            with os.fdopen(fd, 'w', encoding="utf-8") as file:
+                yaml.dump(self.d, file, OrderedDumper, allow_unicode=True, sort_keys=False)
+                file.flush()
+                os.fsync(file.fileno())
+            if os.path.exists(self.filepath):
+                os.chmod(tmp_path, os.stat(self.filepath).st_mode)
+            os.replace(tmp_path, self.filepath)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        self._stamp = _stat_stamp(self.filepath)
+        self._remember()
+        return True
+    
+    
+    async def aread(self, force=False):
+        return await asyncio.to_thread(self.read, force)
+    
+    
+    async def asave(self, force=False):
+        return await asyncio.to_thread(self.save, force)
+    
+    
+    def _remember(self):
+        if self.track_changes:
+            self._snapshot = copy.deepcopy(self.d)
@@ -0,0 +1,63 @@
+"""
+Compares read_yaml/read_json parse paths on a generated multi-megabyte file.
+    
+    python -m benchmarks.bench_files
+"""
+import json
+import os
+import tempfile
+import timeit
+
+import yaml
+from beautools import files
+
+
+
+def make_data(n=20_000):
+    return {f"key_{i}": {"id": i, "name": f"name {i}", "tags": ["a", "b", "c"], "ratio": i / 7} for i in range(n)}
+
+
+def bench(label, func, number=3):
+    best = min(timeit.repeat(func, number=number, repeat=3)) / number
+    print(f"{label:<40} {best * 1000:10.2f} ms")
+    return best
+
+
+def main():
+    data = make_data()
+    with tempfile.TemporaryDirectory() as tmp:
+        ypath = os.path.join(tmp, "data.yaml")
+        jpath = os.path.join(tmp, "data.json")
+        cache_dir = os.path.join(tmp, "cache")
+        with open(ypath, "w", encoding="utf-8") as f:
+            yaml.dump(data, f, Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper))
+        with open(jpath, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        print(f"yaml {os.path.getsize(ypath) / 2 ** 20:.1f} MiB, json {os.path.getsize(jpath) / 2 ** 20:.1f} MiB")
+        
+        
+        def pure_yaml():
+            with open(ypath, encoding="utf-8") as f:
+                return yaml.safe_load(f)
+        
+        
+        def stdlib_json():
+            with open(jpath, encoding="utf-8") as f:
+                return json.load(f)
+        
+        
+        bench("yaml.safe_load (pure python)", pure_yaml, number=1)
+        bench(f"read_yaml ({files.SafeLoader.__name__})", lambda: files.read_yaml(ypath))
+        files.read_yaml(ypath, cache_dir=cache_dir)
+        bench("read_yaml (disk cache hit)", lambda: files.read_yaml(ypath, cache_dir=cache_dir))
+        files.read_yaml(ypath, cache=True)
+        bench("read_yaml (memory cache hit)", lambda: files.read_yaml(ypath, cache=True), number=1000)
+        
+        bench("json.load (stdlib)", stdlib_json)
+        bench(f"read_json (orjson={files.orjson is not None})", lambda: files.read_json(jpath))
+        files.read_json(jpath, cache=True)
+        bench("read_json (memory cache hit)", lambda: files.read_json(jpath, cache=True), number=1000)
+
+
+if __name__ == '__main__':
+    main()
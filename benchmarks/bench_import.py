@@ -0,0 +1,55 @@
+"""
+Import cost of beautools entry points, measured with `python -X importtime` in fresh interpreters.
+    
+    python -m benchmarks.bench_import [--max-ms 30]
+
+Exits with 1 when the light entry point (utils only) exceeds --max-ms.
+"""
+import argparse
+import re
+import subprocess
+import sys
+
+
+
+STATEMENTS = {
+        "import beautools": "import beautools",
+        "from beautools import first_or_none": "from beautools import first_or_none",
+        "from beautools import Cycler": "from beautools import Cycler",
+        "from beautools import files": "from beautools import files",
+        "from beautools import repomixins": "from beautools import repomixins",
+}
+LIGHT = "from beautools import first_or_none"
+_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def import_time_us(statement, repeat=5):
+    """Best-of-repeat sum of cumulative times of top-level imports triggered by statement."""
+    best = None
+    for _ in range(repeat):
+        # modules imported by the interpreter itself are already cached and do not show up
+        proc = subprocess.run([sys.executable, "-X", "importtime", "-c", statement],
+                              capture_output=True, text=True, check=True)
+        total = 0
+        for line in proc.stderr.splitlines():
+            m = _LINE.match(line)
+            if m and len(m.group(3)) == 1:
+                total += int(m.group(2))
+        best = total if best is None else min(best, total)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--max-ms", type=float, default=30)
+    args = parser.parse_args()
+    results = {label: import_time_us(stmt) for label, stmt in STATEMENTS.items()}
+    for label, us in results.items():
+        print(f"{label:<40} {us / 1000:8.1f} ms")
+    if results[LIGHT] / 1000 > args.max_ms:
+        print(f"REGRESSION: '{LIGHT}' takes more than {args.max_ms} ms")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""
+Primary key generation cost and SQLite insert throughput per key kind.
+    
+    python -m benchmarks.bench_keys
+"""
+import os
+import tempfile
+import time
+import timeit
+
+from beautools import repomixins
+from sqlalchemy import Column, MetaData, String, Table, create_engine, insert
+
+
+
+def bench_generation(n=100_000):
+    single = {
+            "uuid4 (undashed_uuid)": repomixins.undashed_uuid,
+            "uuid7 (undashed_uuid7)": repomixins.undashed_uuid7,
+            "ulid": repomixins.ulid,
+    }
+    for label, func in single.items():
+        best = min(timeit.repeat(func, number=n, repeat=3))
+        print(f"{label:<40} {best / n * 1e9:8.0f} ns/key")
+    batch = {
+            "uuid4 batch (undashed_uuids)": repomixins.undashed_uuids,
+            "uuid7 batch (undashed_uuid7s)": repomixins.undashed_uuid7s,
+            "ulid batch (ulids)": repomixins.ulids,
+    }
+    for label, func in batch.items():
+        best = min(timeit.repeat(lambda: func(n), number=1, repeat=3))
+        print(f"{label:<40} {best / n * 1e9:8.0f} ns/key")
+
+
+def bench_inserts(n_batches=50, batch_size=5_000, payload="x" * 100):
+    """Inserts into a table that already holds data, the case where random keys split B-tree pages."""
+    for label, make_keys in (("uuid4", repomixins.undashed_uuids),
+                             ("uuid7", repomixins.undashed_uuid7s),
+                             ("ulid", repomixins.ulids)):
+        with tempfile.TemporaryDirectory() as tmp:
+            engine = create_engine(f"sqlite:///{os.path.join(tmp, 'keys.db')}")
+            table = Table("items", MetaData(), Column("uuid", String, primary_key=True), Column("payload", String))
+            table.metadata.create_all(engine)
+            start = time.perf_counter()
+            with engine.begin() as conn:
+                for _ in range(n_batches):
+                    conn.execute(insert(table), [{"uuid": k, "payload": payload} for k in make_keys(batch_size)])
+            elapsed = time.perf_counter() - start
+            size = os.path.getsize(os.path.join(tmp, "keys.db"))
+            engine.dispose()
+        rows = n_batches * batch_size
+        print(f"sqlite insert {label:<26} {rows / elapsed:10.0f} rows/s  db {size / 2 ** 20:6.1f} MiB")
+
+
+if __name__ == '__main__':
+    bench_generation()
+    bench_inserts()
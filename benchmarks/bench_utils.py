@@ -0,0 +1,107 @@
+"""
+Throughput of utils hot paths on large inputs.
+    
+    python -m benchmarks.bench_utils
+"""
+import copy
+import timeit
+
+from beautools.bimap import MultiIndex
+from beautools.utils import merge, merge_many, reverse_dict
+
+
+
+def legacy_merge(D1s: dict, *D2s: dict):
+    """utils.merge before the stack-based rewrite, kept as the reference point."""
+    def merge_two(D1: dict, D2: dict):
+        for key, value in D1.items():
+            if key in D2:
+                if type(value) is dict:
+                    legacy_merge(D1[key], D2[key])
+                else:
+                    if type(value) in (int, float, str):
+                        D1[key] = [value]
+                    if type(D2[key]) is list:
+                        D1[key].extend(D2[key])
+                    else:
+                        D1[key].append(D2[key])
+        for key, value in D2.items():
+            if key not in D1:
+                D1[key] = [value]
+    
+    
+    for D2n in D2s:
+        merge_two(D1s, D2n)
+
+
+def make_telemetry(n_hosts=2_000, n_metrics=100, offset=0):
+    """n_hosts * n_metrics leaf keys, 200k by default."""
+    return {f"host{h}": {f"metric{m}": h * m + offset for m in range(n_metrics)} for h in range(n_hosts)}
+
+
+def bench(label, func, setup, n_keys, repeat=3):
+    times = []
+    for _ in range(repeat):
+        args = setup()
+        times.append(timeit.timeit(lambda: func(*args), number=1))
+    best = min(times)
+    print(f"{label:<40} {best * 1000:10.2f} ms {n_keys / best / 1e6:8.2f} Mkeys/s")
+    return best
+
+
+def main():
+    a, b, c = make_telemetry(), make_telemetry(offset=1), make_telemetry(offset=2)
+    n_keys = 2 * sum(len(v) for v in a.values())
+    
+    
+    def fresh():
+        return copy.deepcopy(a), b, c
+    
+    
+    bench("legacy merge (append)", lambda t, x, y: legacy_merge(t, x, y), fresh, n_keys)
+    bench("merge (append)", lambda t, x, y: merge(t, x, y), fresh, n_keys)
+    bench("merge_many (overwrite)", lambda t, x, y: merge_many(t, [x, y], "overwrite"), fresh, n_keys)
+    bench("merge_many (sum)", lambda t, x, y: merge_many(t, [x, y], "sum"), fresh, n_keys)
+    
+    bench_reverse()
+
+
+def bench_reverse(n=1_000_000, n_updates=1_000):
+    d = {i: i % 1000 for i in range(n)}
+    updates = {i: -1 for i in range(n_updates)}
+    
+    
+    def bench_once(label, func):
+        best = min(timeit.repeat(func, number=1, repeat=3))
+        print(f"{label:<40} {best * 1000:10.2f} ms")
+    
+    
+    bench_once("reverse_dict (1M build)", lambda: reverse_dict(d))
+    bench_once("MultiIndex (1M build)", lambda: MultiIndex(d))
+    try:
+        import numpy as np
+        keys = np.arange(n)
+        bench_once("MultiIndex.from_arrays (1M build)", lambda: MultiIndex.from_arrays(keys, keys % 1000))
+    except ImportError:
+        pass
+    
+    
+    def reinvert():
+        d.update(updates)
+        return reverse_dict(d)[-1]
+    
+    
+    index = MultiIndex(d)
+    
+    
+    def incremental():
+        index.update(updates)
+        return index.keys_for(-1)
+    
+    
+    bench_once(f"reverse_dict after {n_updates} changes", reinvert)
+    bench_once(f"MultiIndex after {n_updates} changes", incremental)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+"""
+pytest-benchmark suite, kept out of unittests/ because it is slow and machine dependent.
+Baselines are per machine and not committed; record one on the machine you compare on.
+    
+    python -m pytest benchmarks --benchmark-save=baseline          # store a local baseline in benchmarks/.baselines
+    python -m pytest benchmarks --benchmark-compare                # compare with the latest stored run,
+                                                                   # fails on a regression over REGRESSION_THRESHOLD
+"""
+import asyncio
+import importlib.util
+import logging
+
+import pytest
+
+
+
+REGRESSION_THRESHOLD = "min:25%"  # min is far less noisy than mean on shared machines
+
+if importlib.util.find_spec("pytest_benchmark") is None:
+    collect_ignore_glob = ["test_*.py"]
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    # --benchmark-compare-fail is rejected without --benchmark-compare, so it cannot live in pytest.ini
+    if getattr(config.option, "benchmark_compare", None) and not config.option.benchmark_compare_fail:
+        from pytest_benchmark.utils import parse_compare_fail
+        
+        config.option.benchmark_compare_fail = [parse_compare_fail(REGRESSION_THRESHOLD)]
+
+
+@pytest.fixture(autouse=True)
+def quiet_logging():
+    """Library code logs on every cycle/call; measure the logging calls, not terminal output."""
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    root.handlers[:] = [logging.NullHandler()]
+    root.setLevel(logging.INFO)
+    yield
+    root.handlers[:] = handlers
+    root.setLevel(level)
+
+
+@pytest.fixture
+def loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
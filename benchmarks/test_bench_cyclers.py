@@ -0,0 +1,67 @@
+"""Scheduler wake-up cost: N concurrent cyclers with zero sleeps, until each has done CYCLES cycles."""
+import asyncio
+
+import pytest
+from beautools import AsyncCycler, HotAsyncCycler
+
+
+
+CYCLES = 20
+
+
+async def run_until_cycled(cyclers, start, counts):
+    done = asyncio.Event()
+    remaining = len(cyclers)
+    
+    
+    def tick(i):
+        nonlocal remaining
+        counts[i] += 1
+        if counts[i] == CYCLES:
+            remaining -= 1
+            if remaining == 0:
+                done.set()
+        return False
+    
+    
+    for i, cycler in enumerate(cyclers):
+        cycler.tick = lambda i=i: tick(i)
+    tasks = [asyncio.ensure_future(start(c)) for c in cyclers]
+    await done.wait()
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+@pytest.mark.parametrize("n", [10, 1000])
+def test_async_cycler_wakeups(benchmark, loop, n):
+    def scenario():
+        counts = [0] * n
+        cyclers = [AsyncCycler(f"c{i}", DEFAULT_SLEEP=0, WAS_WORK_SLEEP=0, ERROR_SLEEP=0) for i in range(n)]
+        for c in cyclers:
+            async def cycled(c=c):
+                return c.tick()
+            
+            
+            c.async_cycled_func = cycled
+        loop.run_until_complete(run_until_cycled(cyclers, lambda c: c.run(), counts))
+    
+    
+    benchmark.pedantic(scenario, rounds=5, iterations=1)
+
+
+@pytest.mark.parametrize("n", [10, 1000])
+def test_hot_async_cycler_wakeups(benchmark, loop, n):
+    def scenario():
+        counts = [0] * n
+        cyclers = [HotAsyncCycler(f"h{i}", DEFAULT_SLEEP=0, WAS_WORK_SLEEP=0, HOT_SLEEP=0, ERROR_SLEEP=0) for i in range(n)]
+        for c in cyclers:
+            async def run1(c=c):
+                return c.tick()
+            
+            
+            c.run1 = run1
+        loop.run_until_complete(run_until_cycled(cyclers, lambda c: c.loop1(), counts))
+    
+    
+    benchmark.pedantic(scenario, rounds=5, iterations=1)
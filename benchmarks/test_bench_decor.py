@@ -0,0 +1,53 @@
+import asyncio
+import logging
+
+from beautools.decor import a_log_execution_time, log_call, log_execution_time
+
+
+
+def work(x):
+    return x + 1
+
+
+async def awork(x):
+    return x + 1
+
+
+def test_plain_call(benchmark):
+    benchmark(work, 1)
+
+
+def test_log_execution_time(benchmark):
+    benchmark(log_execution_time(work), 1)
+
+
+def test_log_call(benchmark):
+    benchmark(log_call(logging.INFO)(work), 1)
+
+
+def test_log_call_below_level(benchmark):
+    benchmark(log_call(logging.DEBUG)(work), 1)
+
+
+def test_a_log_execution_time(benchmark, loop):
+    wrapped = a_log_execution_time(awork)
+    
+    
+    async def calls():
+        for i in range(1000):
+            await wrapped(i)
+    
+    
+    benchmark(lambda: loop.run_until_complete(calls()))
+
+
+def test_async_log_call(benchmark, loop):
+    wrapped = log_call(logging.INFO)(awork)
+    
+    
+    async def calls():
+        for i in range(1000):
+            await wrapped(i)
+    
+    
+    benchmark(lambda: loop.run_until_complete(calls()))
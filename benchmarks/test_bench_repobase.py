@@ -0,0 +1,62 @@
+"""RepoBase throughput against an in-memory aiosqlite database."""
+import pytest
+
+pytest.importorskip("aiosqlite")
+pytest.importorskip("greenlet")
+
+from beautools.dualrepo import memory_sqlite_engine
+from beautools.repobase import RepoBase
+from sqlalchemy import String
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+
+
+ROWS = 1000
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Item(Base):
+    __tablename__ = "items"
+    id: Mapped[int] = mapped_column(primary_key=True)
+    status: Mapped[str] = mapped_column(String)
+    payload: Mapped[str] = mapped_column(String)
+
+
+@pytest.fixture
+def repo(loop):
+    engine = memory_sqlite_engine()
+    
+    
+    async def setup():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        repo = RepoBase(engine)
+        async with repo:
+            for i in range(ROWS):
+                repo.curr_session.add(Item(id=i, status="new" if i % 10 else "done", payload="x" * 100))
+        return repo
+    
+    
+    yield loop.run_until_complete(setup())
+    loop.run_until_complete(engine.dispose())
+
+
+def test_get_first(benchmark, loop, repo):
+    benchmark(lambda: loop.run_until_complete(repo.get_first(Item, id=ROWS // 2)))
+
+
+def test_get_all(benchmark, loop, repo):
+    result = benchmark(lambda: loop.run_until_complete(repo.get_all(Item, status="new")))
+    assert len(result) == ROWS - ROWS // 10
+
+
+def test_upsert_100(benchmark, loop, repo):
+    async def upsert():
+        async with repo:
+            await repo.upsert(*(Item(id=i, status="done", payload="y" * 100) for i in range(100)))
+    
+    
+    benchmark(lambda: loop.run_until_complete(upsert()))
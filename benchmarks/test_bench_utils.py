@@ -0,0 +1,33 @@
+import copy
+
+from beautools.bimap import MultiIndex
+from beautools.utils import map_many, merge, merge_many, reverse_dict
+
+from .bench_utils import make_telemetry
+
+
+
+def test_merge_append(benchmark):
+    a, b = make_telemetry(200, 100), make_telemetry(200, 100, offset=1)
+    benchmark.pedantic(merge, setup=lambda: ((copy.deepcopy(a), b), {}), rounds=10)
+
+
+def test_merge_many_sum(benchmark):
+    sources = [make_telemetry(200, 100, offset=i) for i in range(3)]
+    benchmark.pedantic(lambda t: merge_many(t, sources, "sum"), setup=lambda: ((copy.deepcopy(sources[0]),), {}), rounds=10)
+
+
+def test_reverse_dict(benchmark):
+    d = {i: i % 1000 for i in range(100_000)}
+    benchmark(reverse_dict, d)
+
+
+def test_multiindex_build(benchmark):
+    d = {i: i % 1000 for i in range(100_000)}
+    benchmark(MultiIndex, d)
+
+
+def test_map_many(benchmark):
+    data = list(range(100_000))
+    f = (lambda x: x + 1)
+    benchmark(lambda: sum(map_many(data, f, f, f, abs)))
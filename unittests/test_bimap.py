@@ -0,0 +1,50 @@
+import pytest
+from beautools.bimap import BiMap, MultiIndex
+from beautools.utils import reverse_dict
+
+
+
+DATA = {"a": [1, 2], "b": 2, "c": 3}
+
+
+def test_multiindex_inverse_matches_reverse_dict():
+    index = MultiIndex(DATA)
+    shape = {k: v[0] if len(v) == 1 else v for k, v in index.inverse().items()}
+    assert shape == reverse_dict(DATA)
+    assert index.inverse() == {1: ["a"], 2: ["a", "b"], 3: ["c"]}
+    assert MultiIndex(DATA, mode=set).keys_for(2) == {"a", "b"}
+
+
+def test_multiindex_incremental_updates():
+    index = MultiIndex(DATA)
+    index["b"] = [3, 4]
+    assert index.keys_for(2) == ["a"]
+    assert index.keys_for(3) == ["c", "b"]
+    
+    del index["c"]
+    index.discard("a", 1)
+    index.add("d", 4)
+    assert not index.has_value(1)
+    assert index.keys_for(1) is None
+    assert index.inverse() == {2: ["a"], 3: ["b"], 4: ["b", "d"]}
+    assert dict(index) == {"a": [2], "b": [3, 4], "d": [4]}
+
+
+def test_multiindex_from_arrays():
+    pytest.importorskip("numpy")
+    index = MultiIndex.from_arrays([1, 2, 1, 3], [10, 20, 30, 10])
+    assert index[1] == [10, 30]
+    assert index.keys_for(10) == [1, 3]
+
+
+def test_bimap():
+    bm = BiMap({"a": 1, "b": 2})
+    assert bm.inverse[2] == "b"
+    bm["a"] = 3
+    assert 1 not in bm.inverse
+    with pytest.raises(ValueError):
+        bm["c"] = 2
+    del bm.inverse[2]
+    assert dict(bm) == {"a": 3}
+    bm.inverse[5] = "z"
+    assert bm["z"] == 5
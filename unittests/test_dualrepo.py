@@ -0,0 +1,96 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("aiosqlite")
+pytest.importorskip("greenlet")
+
+from beautools import dualrepo
+from beautools.dualrepo import DualRepo
+from sqlalchemy import String
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Item(Base):
+    __tablename__ = "items"
+    id: Mapped[int] = mapped_column(primary_key=True)
+    status: Mapped[str] = mapped_column(String, default="new")
+
+
+@pytest.fixture
+def repo():
+    repo = DualRepo.in_memory(Base.metadata)
+    yield repo
+    repo.close()
+
+
+def test_sync_face(repo):
+    repo.sync.save(Item(id=1), Item(id=2, status="done"))
+    assert [i.id for i in repo.sync.get_all(Item, status="new")] == [1]
+    assert repo.sync.get_or_create(Item, id=3).id == 3
+    assert repo.sync.create_if_none(Item(id=9), id=1).id == 1
+    repo.sync.delete(repo.sync.get_first(Item, id=2))
+    assert sorted(i.id for i in repo.sync.get_all(Item)) == [1, 3]
+
+
+def test_async_and_sync_faces_share_one_database(repo):
+    repo.sync.save(Item(id=1))
+    
+    
+    async def async_side():
+        async with repo:
+            await repo.upsert(Item(id=2))
+            # sync ORM code inside the open transaction sees the uncommitted row
+            assert len(await repo.run_sync(dualrepo.get_all, Item)) == 2
+        return [i.id for i in await repo.get_all(Item)]
+    
+    
+    assert sorted(repo.run(async_side())) == [1, 2]
+    assert len(repo.sync.get_all(Item)) == 2
+
+
+def test_blocking_call_inside_loop_is_rejected(repo):
+    async def misuse():
+        repo.sync.get_all(Item)
+    
+    
+    with pytest.raises(RuntimeError, match="run_sync"):
+        asyncio.run(misuse())
+
+
+def test_sync_calls_from_threads_go_to_bound_loop(repo):
+    async def running_loop():
+        return asyncio.get_running_loop()
+    
+    
+    async def service():
+        repo.bind_loop()
+        owner = await asyncio.to_thread(repo.run, running_loop())
+        items = await asyncio.to_thread(repo.sync.get_all, Item)
+        return owner is asyncio.get_running_loop(), items
+    
+    
+    same_loop, items = asyncio.run(service())
+    assert same_loop
+    assert items == []
+    repo.loop = None
+
+
+def test_sync_face_never_joins_an_open_transaction(repo):
+    async def service():
+        repo.bind_loop()
+        async with repo:
+            tx_session = repo.curr_session.sync_session
+            # a worker thread's sync call gets its own session and transaction, not the open one
+            in_own_session = await asyncio.to_thread(repo.sync.run_sync, lambda sess: sess is not tx_session)
+            in_tx_session = await repo.run_sync(lambda sess: sess is tx_session)
+        return in_own_session, in_tx_session
+    
+    
+    assert asyncio.run(service()) == (True, True)
+    repo.loop = None
@@ -0,0 +1,93 @@
+import json
+import os
+
+import pytest
+from beautools import files
+
+
+
+@pytest.fixture(autouse=True)
+def clean_cache():
+    files.clear_cache()
+    yield
+    files.clear_cache()
+
+
+def test_read_yaml_and_json(tmp_path):
+    y = tmp_path / "a.yaml"
+    y.write_text("a: 1\nb: [x, y]\nname: Привет\n", encoding="utf-8")
+    j = tmp_path / "a.json"
+    j.write_text(json.dumps({"a": 1, "b": ["x", "y"], "nan": float("nan")}), encoding="utf-8")
+    
+    assert files.read_yaml(y) == {"a": 1, "b": ["x", "y"], "name": "Привет"}
+    d = files.read_json(j)
+    assert d["b"] == ["x", "y"]
+    assert d["nan"] != d["nan"]  # stdlib fallback for literals orjson rejects
+
+
+def test_memory_cache_skips_reparse(tmp_path, monkeypatch):
+    y = tmp_path / "a.yaml"
+    y.write_text("a: 1\n", encoding="utf-8")
+    calls = []
+    original = files._parse_yaml
+    monkeypatch.setattr(files, "_parse_yaml", lambda raw: calls.append(1) or original(raw))
+    
+    first = files.read_yaml(y, cache=True)
+    first["a"] = "mutated"  # callers get their own copy, the cache is not affected
+    assert files.read_yaml(y, cache=True) == {"a": 1}
+    
+    # touched but identical content -> hash matches, still no reparse
+    os.utime(y, ns=(0, 0))
+    assert files.read_yaml(y, cache=True) == {"a": 1}
+    assert len(calls) == 1
+    
+    y.write_text("a: 2\n", encoding="utf-8")
+    assert files.read_yaml(y, cache=True) == {"a": 2}
+    assert len(calls) == 2
+
+
+def test_disk_cache_survives_memory_clear(tmp_path, monkeypatch):
+    j = tmp_path / "a.json"
+    j.write_text('{"a": [1, 2, 3]}', encoding="utf-8")
+    cache_dir = tmp_path / "cache"
+    
+    assert files.read_json(j, cache_dir=cache_dir) == {"a": [1, 2, 3]}
+    assert len(os.listdir(cache_dir)) == 1
+    
+    monkeypatch.setattr(files, "_parse_json", lambda raw: pytest.fail("must not reparse"))
+    assert files.read_json(j, cache_dir=cache_dir) == {"a": [1, 2, 3]}
+
+
+def test_unwritable_cache_dir_does_not_fail_read(tmp_path):
+    j = tmp_path / "a.json"
+    j.write_text('{"a": 1}', encoding="utf-8")
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("", encoding="utf-8")
+    
+    assert files.read_json(j, cache=True, cache_dir=blocker / "cache") == {"a": 1}
+
+
+def test_iter_yaml_documents(tmp_path):
+    y = tmp_path / "stream.yaml"
+    y.write_text("a: 1\n---\nb: 2\n---\n- 3\n", encoding="utf-8")
+    assert list(files.iter_yaml_documents(y)) == [{"a": 1}, {"b": 2}, [3]]
+
+
+@pytest.mark.parametrize("processes", [None, 2])
+def test_iter_jsonl(tmp_path, processes):
+    j = tmp_path / "data.jsonl"
+    records = [{"i": i, "s": "x" * (i % 7)} for i in range(500)]
+    j.write_text("\n".join(json.dumps(r) for r in records) + "\n\n", encoding="utf-8")
+    assert list(files.iter_jsonl(j, processes=processes, chunk_size=64)) == records
+
+
+def test_iter_line_chunks_cut_at_newline(tmp_path):
+    p = tmp_path / "lines.txt"
+    p.write_bytes(b"aaa\nbb\nc")
+    chunks = list(files.iter_line_chunks(p, chunk_size=2))
+    assert b"".join(chunks) == b"aaa\nbb\nc"
+    assert all(c.endswith(b"\n") for c in chunks[:-1])
+    
+    empty = tmp_path / "empty.txt"
+    empty.write_bytes(b"")
+    assert list(files.iter_line_chunks(empty)) == []
@@ -0,0 +1,55 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from beautools.funcs import amapl, pfilterl, pmapc, pmapl
+from beautools.utils import map_many, pmap_many
+
+
+
+def square(x):
+    return x * x
+
+
+def is_even(x):
+    return x % 2 == 0
+
+
+@pytest.mark.parametrize("executor", ["process", "thread"])
+def test_pmapl_matches_mapl(executor):
+    data = list(range(1000))
+    assert pmapl(square, data, executor=executor, workers=2) == list(map(square, data))
+    assert sorted(pmapl(square, data, executor=executor, workers=2, ordered=False)) == list(map(square, data))
+    assert pfilterl(is_even, iter(data), executor=executor, workers=2, chunksize=7) == list(filter(is_even, data))
+    assert pmapc(set, square, [1, -1, 2], executor=executor) == {1, 4}
+    assert pmapl(square, [], executor=executor) == []
+
+
+def test_pmapl_reuses_given_executor():
+    with ThreadPoolExecutor(2) as pool:
+        assert pmapl(lambda x: x + 1, range(10), executor=pool) == list(range(1, 11))
+        assert pool.submit(square, 3).result() == 9  # not shut down by pmapl
+
+
+def test_pmap_many_matches_map_many():
+    data = list(range(100))
+    assert list(pmap_many(data, square, abs, str, workers=2)) == list(map_many(data, square, abs, str))
+
+
+def test_amapl_limits_concurrency_and_keeps_order():
+    running = 0
+    peak = 0
+    
+    
+    async def slow_square(x):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.001 * (x % 3))
+        running -= 1
+        return x * x
+    
+    
+    assert asyncio.run(amapl(slow_square, range(50), limit=4)) == [x * x for x in range(50)]
+    assert peak == 4
+    assert sorted(asyncio.run(amapl(slow_square, range(50), ordered=False))) == [x * x for x in range(50)]
@@ -0,0 +1,45 @@
+import subprocess
+import sys
+
+import pytest
+
+
+
+def run_python(code):
+    return subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout.strip()
+
+
+def test_light_imports_do_not_pull_heavy_dependencies():
+    loaded = run_python(
+            "import sys\n"
+            "from beautools import first_or_none, merge, Pipeline, MultiIndex\n"
+            "from beautools import funcs\n"
+            "print(sorted(m for m in ('sqlalchemy', 'yaml', 'multiprocessing') if m in sys.modules))"
+    )
+    assert loaded == "[]"
+
+
+def test_lazy_attributes_resolve():
+    import beautools
+    from beautools.cycler import Cycler
+    from beautools.queuedlog import setup_queued_logging
+    from beautools.supervisor import Supervisor
+    from beautools.utils import merge
+    
+    assert beautools.Cycler is Cycler
+    assert beautools.merge is merge
+    assert beautools.Supervisor is Supervisor
+    assert beautools.setup_queued_logging is setup_queued_logging
+    assert beautools.yamlfile.YamlFile.__name__ == "YamlFile"
+    assert {"Cycler", "HotAsyncCycler", "Supervisor", "repomixins", "files"} <= set(dir(beautools))
+    with pytest.raises(AttributeError):
+        beautools.nope
+
+
+def test_star_import_stays_light():
+    loaded = run_python(
+            "import sys\n"
+            "from beautools import *\n"
+            "print(Cycler.__name__, merge.__name__, sorted(m for m in ('sqlalchemy', 'multiprocessing', 'beautools.testools') if m in sys.modules))"
+    )
+    assert loaded == "Cycler merge []"
@@ -0,0 +1,53 @@
+import itertools
+
+import pytest
+from beautools.pipeline import Pipeline
+
+
+
+def test_fuses_adjacent_map_filter_stages():
+    p = Pipeline().map(abs).filter(lambda x: x % 2).map(str).batch(2).map(len).filter(bool)
+    assert [s[0] for s in p.compile()] == ["fused", "batch", "fused"]
+
+
+@pytest.mark.parametrize("run_kwargs", [{}, {"workers": 4, "buffer": 3}, {"prefetch": 2}])
+def test_run_matches_plain_iteration(run_kwargs):
+    p = (Pipeline()
+         .map(lambda x: x * 3)
+         .filter(lambda x: x % 2 == 0)
+         .flat_map(lambda x: (x, x + 1))
+         .batch(4)
+         .map(sum)
+         .take(5))
+    flat = [y for x in range(100) if x * 3 % 2 == 0 for y in (x * 3, x * 3 + 1)]
+    expected = [sum(flat[i:i + 4]) for i in range(0, len(flat), 4)][:5]
+    assert p.to_list(range(100), **run_kwargs) == expected
+
+
+def test_take_stops_infinite_source():
+    assert Pipeline().map(lambda x: x + 1).take(3).to_list(itertools.count(), workers=2) == [1, 2, 3]
+    assert Pipeline().take(3).to_list(itertools.count(), prefetch=4) == [0, 1, 2]
+
+
+def test_pipeline_is_immutable_and_reusable():
+    base = Pipeline().map(lambda x: x + 1)
+    doubled = base.map(lambda x: x * 2)
+    assert base.to_list([1, 2]) == [2, 3]
+    assert doubled.to_list([1, 2]) == [4, 6]
+
+
+def test_prefetch_propagates_source_errors():
+    def source():
+        yield 1
+        raise ValueError("boom")
+    
+    
+    with pytest.raises(ValueError, match="boom"):
+        Pipeline().to_list(source(), prefetch=2)
+
+
+def test_batch_as_array():
+    numpy = pytest.importorskip("numpy")
+    batches = Pipeline().batch(3, as_array=True, dtype=float).map(lambda a: a * 2).to_list(range(7))
+    assert [b.tolist() for b in batches] == [[0, 2, 4], [6, 8, 10], [12]]
+    assert all(isinstance(b, numpy.ndarray) for b in batches)
@@ -0,0 +1,75 @@
+import logging
+import queue
+import threading
+
+import pytest
+
+from beautools import decor
+from beautools.queuedlog import BoundedQueueHandler, QueuedLogging
+
+
+
+class ListHandler(logging.Handler):
+    def __init__(self, gate=None):
+        super().__init__()
+        self.records = []
+        self.gate = gate
+    
+    
+    def emit(self, record):
+        if self.gate is not None:
+            self.gate.wait()
+        self.records.append(record)
+
+
+def _record(msg):
+    return logging.LogRecord("beautools.test", logging.INFO, __file__, 1, msg, None, None)
+
+
+def test_records_reach_handler_via_listener():
+    target = ListHandler()
+    with QueuedLogging(target, level=logging.DEBUG) as ql:
+        logging.getLogger("beautools.cycler").info("%s: Cycle %s", "job", 1)
+        assert ql.logger.propagate is False
+    assert [r.getMessage() for r in target.records] == ["job: Cycle 1"]
+    assert logging.getLogger("beautools").propagate is True
+
+
+def test_decorator_exceptions_are_logged_not_printed(capsys):
+    target = ListHandler()
+    
+    @decor.catch_print_swallow_exc
+    def boom():
+        raise KeyError("x")
+    
+    with QueuedLogging(target, level=logging.DEBUG):
+        assert boom() is None
+    assert capsys.readouterr().err == ""
+    assert target.records[0].levelno == logging.ERROR
+    assert "KeyError" in target.records[0].getMessage()
+
+
+@pytest.mark.parametrize("overflow, kept", [("drop_new", ["a", "b"]), ("drop_oldest", ["b", "c"])])
+def test_overflow_policies(overflow, kept):
+    handler = BoundedQueueHandler(queue.Queue(2), overflow)
+    for msg in "abc":
+        handler.handle(_record(msg))
+    assert handler.dropped == 1
+    assert [handler.queue.get_nowait().getMessage() for _ in range(2)] == kept
+
+
+def test_slow_handler_does_not_block_caller():
+    gate = threading.Event()
+    target = ListHandler(gate)
+    with QueuedLogging(target, maxsize=4, level=logging.INFO) as ql:
+        log = logging.getLogger("beautools.test")
+        for i in range(20):
+            log.info("msg %s", i)  # returns at once although the handler is stuck
+        assert ql.dropped >= 15
+        gate.set()
+    assert 1 <= len(target.records) <= 5
+
+
+def test_bad_overflow():
+    with pytest.raises(ValueError):
+        BoundedQueueHandler(queue.Queue(1), "explode")
@@ -0,0 +1,95 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("aiosqlite")
+pytest.importorskip("greenlet")
+
+from beautools.dualrepo import memory_sqlite_engine
+from beautools.repobase import RepoBase
+from sqlalchemy import String
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Item(Base):
+    __tablename__ = "items"
+    id: Mapped[int] = mapped_column(primary_key=True)
+    origin: Mapped[str] = mapped_column(String)
+
+
+async def _make_repo(n_replicas, **kwargs):
+    engines = [memory_sqlite_engine() for _ in range(n_replicas + 1)]
+    for i, engine in enumerate(engines):
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+            await conn.execute(Item.__table__.insert(), [{"id": 1, "origin": "primary" if i == 0 else f"replica{i}"}])
+    return RepoBase(engines[0], replicas=engines[1:], **kwargs)
+
+
+async def _origin(repo):
+    return (await repo.get_first(Item, id=1)).origin
+
+
+def test_round_robin():
+    async def main():
+        repo = await _make_repo(2)
+        return [await _origin(repo) for _ in range(4)], repo.engine_load()
+    
+    origins, load = asyncio.run(main())
+    assert origins == ["replica1", "replica2", "replica1", "replica2"]
+    assert [(l["role"], l["reads"], l["in_flight"]) for l in load] == [("primary", 0, 0), ("replica", 2, 0), ("replica", 2, 0)]
+
+
+def test_least_loaded_picks_idle_replica():
+    async def main():
+        repo = await _make_repo(2, routing="least_loaded")
+        repo._replica_loads[0].in_flight = 5
+        return await _origin(repo)
+    
+    assert asyncio.run(main()) == "replica2"
+
+
+def test_reads_pinned_to_primary_in_transaction_and_after_write():
+    async def main():
+        repo = await _make_repo(1, read_your_writes=60)
+        async with repo:
+            await repo.upsert(Item(id=2, origin="uncommitted"))
+            in_tx = await _origin(repo), await repo.get_first(Item, id=2), (await repo.tx_get_first(Item, id=2)).origin
+        after_write = await _origin(repo)
+        repo.read_your_writes = 0
+        later = await _origin(repo)
+        return in_tx, after_write, later
+    
+    assert asyncio.run(main()) == (("primary", None, "uncommitted"), "primary", "replica1")
+
+
+def test_read_only_and_rolled_back_blocks_do_not_pin():
+    async def main():
+        repo = await _make_repo(1, read_your_writes=60)
+        async with repo:
+            await _origin(repo)
+        with pytest.raises(KeyError):
+            async with repo:
+                await repo.upsert(Item(id=3, origin="primary"))
+                raise KeyError
+        return await _origin(repo)
+    
+    assert asyncio.run(main()) == "replica1"
+
+
+def test_without_replicas_reads_primary():
+    async def main():
+        repo = await _make_repo(0)
+        return await _origin(repo)
+    
+    assert asyncio.run(main()) == "primary"
+
+
+def test_bad_routing():
+    with pytest.raises(ValueError):
+        RepoBase(memory_sqlite_engine(), routing="random")
@@ -0,0 +1,137 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("aiosqlite")
+pytest.importorskip("greenlet")
+
+from beautools.dualrepo import memory_sqlite_engine
+from beautools.repobase import RepoBase
+from beautools.repomixins import TimestampMixin
+from sqlalchemy import ForeignKey, String, event
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship, selectinload
+
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Wide(Base):
+    __tablename__ = "wide"
+    id: Mapped[int] = mapped_column(primary_key=True)
+    a: Mapped[str] = mapped_column(String, default="a")
+    b: Mapped[str] = mapped_column(String, default="b")
+    c: Mapped[str] = mapped_column(String, default="c")
+
+
+class Parent(TimestampMixin, Base):
+    __tablename__ = "parents"
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(String, default="p")
+    kids: Mapped[list["Kid"]] = relationship()
+
+
+class Kid(Base):
+    __tablename__ = "kids"
+    id: Mapped[int] = mapped_column(primary_key=True)
+    parent_id: Mapped[int] = mapped_column(ForeignKey("parents.id"))
+
+
+def _run(scenario):
+    async def main():
+        engine = memory_sqlite_engine()
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        statements = []
+        event.listen(engine.sync_engine, "before_cursor_execute",
+                lambda conn, cursor, stmt, params, context, many: statements.append((stmt, many)))
+        repo = RepoBase(engine)
+        async with repo:
+            await repo.upsert(*(Wide(id=i) for i in range(1, 6)))
+        statements.clear()
+        result = await scenario(repo)
+        return result, [(stmt, many) for stmt, many in statements if stmt.startswith("UPDATE")]
+    
+    return asyncio.run(main())
+
+
+def test_update_emits_only_dirty_columns_grouped():
+    async def scenario(repo):
+        objs = sorted(await repo.get_all(Wide), key=lambda w: w.id)
+        objs[0].a = "x"
+        objs[1].a = "y"
+        objs[2].b = "z"
+        async with repo:
+            await repo.update(*objs)
+        async with repo:
+            await repo.update(*objs)  # nothing left to write
+        return [(w.id, w.a, w.b, w.c) for w in sorted(await repo.get_all(Wide), key=lambda w: w.id)]
+    
+    rows, updates = _run(scenario)
+    assert rows[:3] == [(1, "x", "b", "c"), (2, "y", "b", "c"), (3, "a", "z", "c")]
+    assert sorted(updates) == [("UPDATE wide SET a=? WHERE wide.id = ?", True), ("UPDATE wide SET b=? WHERE wide.id = ?", False)]
+
+
+def test_update_merges_new_objects():
+    async def scenario(repo):
+        async with repo:
+            await repo.update(Wide(id=9, c="new"))
+        return (await repo.get_first(Wide, id=9)).c
+    
+    assert _run(scenario)[0] == "new"
+
+
+def test_bulk_update():
+    async def scenario(repo):
+        async with repo:
+            sent = await repo.bulk_update(Wide, [{"id": 1, "c": "1"}, {"id": 2, "c": "2"}, {"id": 3, "a": "3"}])
+        rows = [(w.id, w.a, w.c) for w in sorted(await repo.get_all(Wide), key=lambda w: w.id)]
+        return sent, rows
+    
+    (sent, rows), updates = _run(scenario)
+    assert sent == 3
+    assert rows[:3] == [(1, "a", "1"), (2, "a", "2"), (3, "3", "c")]
+    assert len(updates) == 2
+
+
+def test_bulk_update_requires_pk():
+    async def scenario(repo):
+        async with repo:
+            await repo.bulk_update(Wide, [{"a": "x"}])
+    
+    with pytest.raises(ValueError):
+        _run(scenario)
+
+
+async def _load_parent(repo):
+    async with repo.asmk() as sess:
+        return await sess.get(Parent, 1, options=[selectinload(Parent.kids)])
+
+
+def test_update_merges_relationship_changes():
+    async def scenario(repo):
+        async with repo:
+            await repo.upsert(Parent(id=1))
+        parent = await _load_parent(repo)
+        parent.kids.append(Kid(id=5))
+        async with repo:
+            await repo.update(parent)
+        return [k.id for k in (await _load_parent(repo)).kids]
+    
+    assert _run(scenario)[0] == [5]
+
+
+def test_update_keeps_onupdate_columns_readable():
+    async def scenario(repo):
+        async with repo:
+            await repo.upsert(Parent(id=1))
+        parent = await _load_parent(repo)
+        before = parent.modified
+        parent.name = "renamed"
+        async with repo:
+            await repo.update(parent)
+        reloaded = await _load_parent(repo)
+        return parent.modified == before, reloaded.modified != before, reloaded.name
+    
+    assert _run(scenario)[0] == (True, True, "renamed")
@@ -0,0 +1,79 @@
+import time
+import uuid
+
+from beautools import repomixins
+
+
+
+def test_uuid7_layout_and_order():
+    keys = [repomixins.undashed_uuid7()]
+    time.sleep(0.002)
+    keys.append(repomixins.undashed_uuid7())
+    for key in keys:
+        u = uuid.UUID(key)
+        assert key == key.upper() and len(key) == 32
+        assert u.version == 7 and u.variant == uuid.RFC_4122
+        assert abs((u.int >> 80) - time.time() * 1000) < 5_000
+    assert keys == sorted(keys)
+
+
+def test_batches():
+    v4 = repomixins.undashed_uuids(100)
+    assert len(set(v4)) == 100
+    assert all(uuid.UUID(k).version == 4 and uuid.UUID(k).variant == uuid.RFC_4122 for k in v4)
+    
+    v7 = repomixins.undashed_uuid7s(100)
+    assert len(set(v7)) == 100 and v7 == sorted(v7)
+    assert all(uuid.UUID(k).version == 7 for k in v7)
+    
+    ul = repomixins.ulids(100)
+    assert len(set(ul)) == 100 and ul == sorted(ul)
+    assert repomixins.undashed_uuids(0) == []
+
+
+def test_ulid_format():
+    key = repomixins.ulid()
+    assert len(key) == 26 and key[0] <= "7"
+    assert set(key) <= set("0123456789ABCDEFGHJKMNPQRSTVWXYZ")
+    assert key[:10] <= repomixins.ulids(1)[0][:10]
+
+
+def test_auto_repr_never_loads():
+    from sqlalchemy import String, create_engine, event
+    from sqlalchemy.orm import DeclarativeBase, Mapped, Session, deferred, mapped_column
+    
+    
+    class Base(DeclarativeBase):
+        pass
+    
+    
+    @repomixins.auto_repr
+    class Item(Base):
+        __tablename__ = "items"
+        id: Mapped[int] = mapped_column(primary_key=True)
+        name: Mapped[str] = mapped_column(String)
+        blob: Mapped[str] = deferred(mapped_column(String))
+    
+    
+    @repomixins.auto_repr(fields=["name"], max_len=None)
+    class Short(repomixins.SerialPK_Mixin, Base):
+        __tablename__ = "shorts"
+        name: Mapped[str] = mapped_column(String)
+    
+    
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    queries = []
+    event.listen(engine, "before_cursor_execute", lambda *args: queries.append(args[2]))
+    with Session(engine) as sess:
+        sess.add_all([Item(id=1, name="a very long name", blob="b"), Short(name="a very long name")])
+        sess.commit()  # expires everything
+        queries.clear()
+        item = sess.get(Item, 1)
+        n_queries = len(queries)
+        assert repr(item) == "Item(id=1, name='a very lo, blob=<not loaded>)"
+        sess.expire(item)
+        assert repr(item) == "Item(id=<not loaded>, name=<not loaded>, blob=<not loaded>)"
+        assert len(queries) == n_queries
+        short = sess.get(Short, 1)
+        assert repr(short) == "Short(name='a very long name')"
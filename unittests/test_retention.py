@@ -0,0 +1,112 @@
+import asyncio
+import datetime
+
+import pytest
+
+pytest.importorskip("aiosqlite")
+pytest.importorskip("greenlet")
+
+from beautools.dualrepo import DualRepo
+from beautools.repomixins import TimestampMixin, utcnow
+from beautools.retention import Retention, RetentionCycler
+from sqlalchemy import event
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Event(TimestampMixin, Base):
+    __tablename__ = "events"
+    id: Mapped[int] = mapped_column(primary_key=True)
+
+
+@pytest.fixture
+def repo():
+    repo = DualRepo.in_memory(Base.metadata)
+    now = utcnow()
+    repo.sync.save(*(Event(id=i, created=now - datetime.timedelta(days=i)) for i in range(10)))
+    yield repo
+    repo.close()
+
+
+def _ids(repo):
+    return sorted(e.id for e in repo.sync.get_all(Event))
+
+
+def test_timestamp_columns_are_indexed():
+    assert {tuple(c.name for c in ix.columns) for ix in Event.__table__.indexes} == {("created",), ("modified",)}
+
+
+def test_prune_in_batches(repo):
+    deletes = []
+    event.listen(repo.db.sync_engine, "before_cursor_execute",
+            lambda conn, cursor, stmt, params, context, many: deletes.append(stmt) if stmt.startswith("DELETE") else None)
+    retention = Retention(repo, Event, max_age=datetime.timedelta(days=3, hours=12), batch_size=2)
+    assert repo.run(retention.prune()) == 6
+    assert _ids(repo) == [0, 1, 2, 3]
+    assert len(deletes) == 4  # 2 + 2 + 2 + an empty batch
+    assert "LIMIT" in deletes[0]
+
+
+def test_max_batches_bounds_one_call(repo):
+    retention = Retention(repo, Event, max_age=0.5 * 86400, batch_size=3, max_batches=2)
+    assert repo.run(retention.prune()) == 6
+    assert repo.run(retention.prune()) == 3
+    assert _ids(repo) == [0]
+
+
+def test_retention_cycler(repo):
+    cycler = RetentionCycler("retention", Retention(repo, Event, max_age=datetime.timedelta(days=5)))
+    assert repo.run(cycler.async_cycled_func()) is True
+    assert repo.run(cycler.async_cycled_func()) is False
+    assert _ids(repo) == [0, 1, 2, 3, 4]
+
+
+class FakeSession:
+    def __init__(self, rows):
+        self.rows = rows
+        self.executed = []
+    
+    
+    async def __aenter__(self):
+        return self
+    
+    
+    async def __aexit__(self, *exc):
+        return False
+    
+    
+    def begin(self):
+        return self
+    
+    
+    async def execute(self, stmt, params=None):
+        self.executed.append((str(stmt), params))
+        rows = self.rows
+        
+        
+        class Result:
+            def all(self):
+                return rows
+        
+        
+        return Result()
+
+
+def test_drop_partitions_only_expired_and_qualified(repo):
+    sess = FakeSession([
+            ("public", "events_2020", "FOR VALUES FROM ('2020-01-01 00:00:00+00') TO ('2021-01-01 00:00:00+00')"),
+            ("public", "events_now", "FOR VALUES FROM ('2021-01-01 00:00:00+00') TO ('2999-01-01 00:00:00+00')"),
+            ("public", "events_odd", "FOR VALUES FROM ('0') TO ('1000')"),
+            ("public", "events_default", "DEFAULT"),
+    ])
+    retention = Retention(repo, Event, max_age=datetime.timedelta(days=1))
+    retention.repo = type("R", (), {"asmk": lambda self: sess})()
+    
+    assert asyncio.run(retention.drop_partitions()) == ['"public"."events_2020"']
+    lookup_params = sess.executed[0][1]
+    assert lookup_params == {"table": "events", "schema": None, "column": "created"}
+    assert sess.executed[1][0] == 'DROP TABLE "public"."events_2020"'
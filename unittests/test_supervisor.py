@@ -0,0 +1,148 @@
+import os
+import time
+
+import pytest
+
+from beautools.cycler import AsyncCycler, Cycler
+from beautools.supervisor import Supervisor
+
+
+
+class Idle(AsyncCycler):
+    async def async_cycled_func(self):
+        return False
+
+
+class SyncIdle(Cycler):
+    def cycled_func(self):
+        return False
+
+
+class Touching(Cycler):
+    def __init__(self, name, directory, **kwargs):
+        super().__init__(name, **kwargs)
+        self.directory = directory
+    
+    
+    def cycled_func(self):
+        (self.directory / self.name).touch()
+        return False
+
+
+class Counting(AsyncCycler):
+    def __init__(self, name, path, **kwargs):
+        super().__init__(name, **kwargs)
+        self.path = path
+        self.count = 0
+    
+    
+    async def async_cycled_func(self):
+        self.count += 1
+        self.path.write_text(str(self.count))
+        return False
+
+
+class Crashing(AsyncCycler):
+    async def async_cycled_func(self):
+        os._exit(3)
+
+
+class Returning(AsyncCycler):
+    async def run(self):
+        return
+
+
+class Blocking(AsyncCycler):
+    async def async_cycled_func(self):
+        time.sleep(60)  # holds the event loop, no more reports
+
+
+def _poll_until(sup, cond, limit=10):
+    deadline = time.monotonic() + limit
+    while not cond(sup.health()):
+        assert time.monotonic() < deadline, sup.health()
+        sup.poll(0.05)
+
+
+def test_static_and_hash_sharding():
+    sup = Supervisor(workers=2)
+    assert [sup.register(Idle(n)) for n in "abc"] == [0, 1, 0]
+    assert sup.register(Idle("d"), worker=1) == 1
+    assert sup.assignments() == [["a", "c"], ["b", "d"]]
+    
+    hashed = Supervisor(workers=4, sharding="hash")
+    again = Supervisor(workers=4, sharding="hash")
+    names = [f"job{i}" for i in range(20)]
+    assert [hashed.register(Idle(n)) for n in names] == [again.register(Idle(n)) for n in names]
+    assert len({i for i, names in enumerate(hashed.assignments()) if names}) > 1
+
+
+def test_register_validation():
+    with pytest.raises(TypeError):
+        Supervisor(workers=1).register(object())
+    with pytest.raises(ValueError):
+        Supervisor(sharding="random")
+
+
+def test_workers_report_health():
+    sup = Supervisor(workers=2, report_interval=0.05, mp_context="fork")
+    sup.register(Idle("a", DEFAULT_SLEEP=0.01))
+    sup.register(SyncIdle("b", DEFAULT_SLEEP=0.01))
+    with sup:
+        _poll_until(sup, lambda health: all(h["report_age"] is not None for h in health))
+        health = sup.health()
+    assert [h["cyclers"] for h in health] == [{"a": True}, {"b": True}]
+    assert all(h["alive"] and h["healthy"] and h["restarts"] == 0 for h in health)
+    assert all(h["pid"] != os.getpid() for h in health)
+    assert not any(h["alive"] for h in sup.health())
+
+
+def test_crashed_worker_restarts_with_backoff():
+    sup = Supervisor(workers=2, backoff=0.05, max_backoff=1, report_interval=0.05, mp_context="fork")
+    sup.register(Crashing("boom"))
+    sup.register(Idle("steady", DEFAULT_SLEEP=0.01))
+    with sup:
+        _poll_until(sup, lambda health: health[0]["restarts"] >= 3)
+        slots = sup.slots
+        assert slots[0].failures >= 3
+        assert sup.health()[1]["restarts"] == 0
+
+
+def test_failed_async_cycler_exits_worker_with_sync_threads():
+    sup = Supervisor(workers=1, backoff=0.05, max_backoff=1, report_interval=0.05, mp_context="fork")
+    sup.register(SyncIdle("sync", DEFAULT_SLEEP=0.01))
+    sup.register(Returning("returning"))
+    with sup:
+        _poll_until(sup, lambda health: health[0]["restarts"] >= 2)
+
+
+def test_stale_worker_is_killed_and_restarted():
+    sup = Supervisor(workers=1, backoff=0.05, max_backoff=1, report_interval=0.05, stale_after=0.5, mp_context="fork")
+    sup.register(Blocking("blocking"))
+    with sup:
+        _poll_until(sup, lambda health: health[0]["report_age"] is not None)
+        sup.slots[0].last_seen -= 1
+        assert not sup.health()[0]["healthy"]
+        _poll_until(sup, lambda health: health[0]["restarts"] >= 1)
+
+
+def test_every_sync_cycler_gets_a_thread(tmp_path):
+    sup = Supervisor(workers=1, report_interval=0.05, mp_context="fork")
+    for i in range(40):
+        sup.register(Touching(f"c{i}", tmp_path, DEFAULT_SLEEP=0.01))
+    with sup:
+        deadline = time.monotonic() + 10
+        while len(os.listdir(tmp_path)) < 40:
+            assert time.monotonic() < deadline, sorted(os.listdir(tmp_path))
+            time.sleep(0.05)
+
+
+def test_worker_keeps_cycling_when_parent_does_not_poll(tmp_path):
+    counter = tmp_path / "count"
+    sup = Supervisor(workers=1, report_interval=0.0005, mp_context="fork")
+    sup.register(Counting("counting", counter, DEFAULT_SLEEP=0.001))
+    with sup:
+        time.sleep(1.5)  # far more reports than a pipe buffer holds
+        before = int(counter.read_text())
+        time.sleep(0.3)
+        assert int(counter.read_text()) > before
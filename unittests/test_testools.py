@@ -0,0 +1,116 @@
+import datetime
+import time
+
+import pytest
+from beautools import AsyncCycler, Cycler, HotAsyncCycler
+from beautools.testools import VirtualClock, trace_attr, untrace_attr
+
+
+
+DAY = 24 * 3600
+
+
+def test_async_cycler_runs_a_day_instantly():
+    clock = VirtualClock()
+    calls = []
+    
+    
+    async def work():
+        calls.append(clock.now())
+        return len(calls) % 2 == 0
+    
+    
+    started = time.perf_counter()
+    with clock.patch():
+        clock.run(AsyncCycler("c", work, DEFAULT_SLEEP=10, WAS_WORK_SLEEP=20).run(), for_seconds=DAY)
+    assert time.perf_counter() - started < 10
+    assert clock.elapsed == DAY
+    assert len(calls) == DAY // 15 + 1
+    assert clock.sleeps[:3] == [(clock.start, 10),
+                                (clock.start + datetime.timedelta(seconds=10), 20),
+                                (clock.start + datetime.timedelta(seconds=30), 10)]
+
+
+def test_sync_cycler_error_backoff():
+    clock = VirtualClock()
+    
+    
+    class Failing(Cycler):
+        def cycled_func(self):
+            raise ValueError("boom")
+    
+    
+    with clock.patch():
+        clock.run_sync(Failing("f", DEFAULT_SLEEP=1, ERROR_SLEEP=60).run, for_seconds=3600)
+    assert [s for _, s in clock.sleeps] == [60] * 60
+
+
+def test_hot_async_cycler_hot_window():
+    clock = VirtualClock(datetime.datetime(2025, 4, 28, 8, 0))
+    old_hot_times = HotAsyncCycler.HOT_TIMES
+    HotAsyncCycler.HOT_TIMES = [(datetime.time(9, 0), datetime.time(9, 1))]
+    try:
+        async def work():
+            return False
+        
+        
+        with clock.patch():
+            clock.run(HotAsyncCycler("h", work, HOT_SLEEP=0.5, DEFAULT_SLEEP=30).loop1(), for_seconds=DAY)
+    finally:
+        HotAsyncCycler.HOT_TIMES = old_hot_times
+    hot = [when for when, seconds in clock.sleeps if seconds == 0.5]
+    assert hot and all(datetime.time(9, 0) <= when.time() <= datetime.time(9, 1, 1) for when in hot)
+
+
+class Point:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+def test_trace_attr_is_per_instance_and_bounded():
+    traced, other = Point(0, 0), Point(0, 0)
+    trace_x = trace_attr(traced, "x", maxlen=3)
+    trace_y = trace_attr(traced, "y", timestamps=True)
+    for i in range(1, 6):
+        traced.x = i
+        other.x = -i
+    traced.y = 7
+    
+    assert trace_x.values == [3, 4, 5]
+    assert trace_y.values == [0, 7]
+    assert all(isinstance(t, float) for t, _ in trace_y.history)
+    assert isinstance(traced, Point) and traced.x == 5
+    assert type(other) is Point and "x" not in vars(Point)
+    
+    untrace_attr(traced, "x")
+    traced.x = 100
+    assert trace_x.values == [3, 4, 5]
+    untrace_attr(traced, "y")
+    assert type(traced) is Point
+    assert vars(traced) == {"x": 100, "y": 7}
+
+
+def test_trace_attr_monkeypatch_undo(monkeypatch):
+    p = Point(1, 2)
+    with monkeypatch.context() as m:
+        trace = trace_attr(p, "x", monkeypatch=m)
+        p.x = 3
+        assert trace.values == [1, 3]
+    assert type(p) is Point
+    assert vars(p) == {"x": 3, "y": 2}
+
+
+class Celsius:
+    def __init__(self):
+        self._c = 0
+    
+    
+    @property
+    def fahrenheit(self):
+        return self._c * 9 / 5 + 32
+
+
+def test_trace_attr_rejects_data_descriptors():
+    with pytest.raises(TypeError, match="fahrenheit"):
+        trace_attr(Celsius(), "fahrenheit")
@@ -0,0 +1,88 @@
+import copy
+import sys
+
+import pytest
+from beautools.utils import merge, merge_many
+
+
+
+def legacy_merge(D1s: dict, *D2s: dict):
+    """utils.merge before the stack-based rewrite, the reference for its behaviour."""
+    def merge_two(D1: dict, D2: dict):
+        for key, value in D1.items():
+            if key in D2:
+                if type(value) is dict:
+                    legacy_merge(D1[key], D2[key])
+                else:
+                    if type(value) in (int, float, str):
+                        D1[key] = [value]
+                    if type(D2[key]) is list:
+                        D1[key].extend(D2[key])
+                    else:
+                        D1[key].append(D2[key])
+        for key, value in D2.items():
+            if key not in D1:
+                D1[key] = [value]
+    
+    
+    for D2n in D2s:
+        merge_two(D1s, D2n)
+
+
+def test_merge_matches_legacy_behaviour():
+    d1 = {"a": 1, "b": {"x": 1.5, "y": "s"}, "c": [1], "only1": 0}
+    d2 = {"a": 2, "b": {"x": [2, 3], "z": {"deep": 1}}, "c": 2, "new": {"k": 1}}
+    d3 = {"a": [3], "b": {"x": 4, "z": {"deep": 2}}, "new": 5}
+    expected = copy.deepcopy(d1)
+    legacy_merge(expected, copy.deepcopy(d2), copy.deepcopy(d3))
+    merge(d1, d2, d3)
+    assert d1 == expected
+
+
+@pytest.mark.parametrize("strategy,expected", [
+        ("overwrite", {"a": 2, "n": {"x": 2, "y": 1}, "b": 3}),
+        ("sum", {"a": 3, "n": {"x": 3, "y": 1}, "b": 3}),
+        (max, {"a": 2, "n": {"x": 2, "y": 1}, "b": 3}),
+])
+def test_merge_many_strategies(strategy, expected):
+    src = {"a": 2, "n": {"x": 2}, "b": 3}
+    target = merge_many({"a": 1, "n": {"x": 1, "y": 1}}, [src], strategy=strategy)
+    assert target == expected
+    target["n"]["x"] = 100
+    assert src == {"a": 2, "n": {"x": 2}, "b": 3}
+
+
+def test_merge_many_path_reducers():
+    target = {"stats": {"count": 1, "last": "a"}, "tags": {"t": 1}}
+    merge_many(target, [{"stats": {"count": 2, "last": "b"}, "tags": {"u": 2}},
+                        {"stats": {"count": 3, "last": "c"}}],
+               strategy="overwrite",
+               reducers={("stats", "count"): "sum", ("tags",): lambda old, new: sorted({**old, **new})})
+    assert target == {"stats": {"count": 6, "last": "c"}, "tags": ["t", "u"]}
+
+
+def test_merge_many_accepts_generator():
+    target = merge_many({"a": 1}, ({"a": i} for i in (2, 3)), strategy="sum")
+    assert target == {"a": 6}
+
+
+def test_merge_many_deeper_than_recursion_limit():
+    depth = sys.getrecursionlimit() + 100
+    
+    
+    def nested(leaf):
+        d = leaf
+        for _ in range(depth):
+            d = {"n": d}
+        return d
+    
+    
+    target = merge_many(nested({"v": 1}), [nested({"v": 2})], strategy="sum")
+    for _ in range(depth):
+        target = target["n"]
+    assert target == {"v": 3}
+
+
+def test_merge_many_unknown_strategy():
+    with pytest.raises(ValueError):
+        merge_many({}, [{}], strategy="nope")
@@ -0,0 +1,49 @@
+import asyncio
+
+import pytest
+from beautools.watchedconfig import WatchedConfig
+
+
+
+def test_reload_swaps_and_notifies_only_on_change(tmp_path):
+    p = tmp_path / "conf.yaml"
+    p.write_text("a: 1\n", encoding="utf-8")
+    wc = WatchedConfig(p)
+    old = wc.d
+    seen = []
+    wc.subscribe(seen.append)
+    
+    assert wc.reload() is False
+    p.write_text("a: 2\n", encoding="utf-8")
+    assert wc.reload() is True
+    assert wc["a"] == 2
+    assert old == {"a": 1}  # readers holding the old dict are not affected
+    assert seen == [{"a": 2}]
+
+
+def test_reload_keeps_previous_config_on_parse_error(tmp_path):
+    p = tmp_path / "conf.yaml"
+    p.write_text("a: 1\n", encoding="utf-8")
+    wc = WatchedConfig(p)
+    p.write_text("a: [\n", encoding="utf-8")
+    assert wc.reload() is False
+    assert wc.d == {"a": 1}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("force_polling", [False, True])
+async def test_run_propagates_changes(tmp_path, force_polling):
+    p = tmp_path / "conf.yaml"
+    p.write_text("a: 1\n", encoding="utf-8")
+    wc = WatchedConfig(p, debounce=0.02, poll_interval=0.02, force_polling=force_polling)
+    queue = wc.subscribe_queue()
+    task = asyncio.create_task(wc.run())
+    try:
+        await asyncio.sleep(0.05)
+        for i in range(5):  # burst of writes -> one reload with the final content
+            p.write_text(f"a: {i + 10}\n", encoding="utf-8")
+        new_d = await asyncio.wait_for(queue.get(), 2)
+        assert new_d == {"a": 14}
+        assert wc.d == {"a": 14}
+    finally:
+        task.cancel()
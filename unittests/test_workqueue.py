@@ -0,0 +1,95 @@
+import pytest
+
+pytest.importorskip("aiosqlite")
+pytest.importorskip("greenlet")
+
+from beautools.dualrepo import DualRepo
+from beautools.repomixins import QueueItemMixin, SerialPK_Mixin
+from beautools.workqueue import QueueConsumer, WorkQueue
+from sqlalchemy import String, text
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Job(SerialPK_Mixin, QueueItemMixin, Base):
+    __tablename__ = "jobs"
+    payload: Mapped[str] = mapped_column(String)
+
+
+@pytest.fixture
+def repo():
+    repo = DualRepo.in_memory(Base.metadata)
+    repo.sync.save(*(Job(payload=f"p{i}") for i in range(10)))
+    yield repo
+    repo.close()
+
+
+def test_claims_are_disjoint_and_acked_in_bulk(repo):
+    queue = WorkQueue(repo, Job, batch_size=4)
+    a = repo.run(queue.claim())
+    b = repo.run(queue.claim())
+    assert [j.id for j in a] == [1, 2, 3, 4]
+    assert [j.id for j in b] == [5, 6, 7, 8]
+    assert len({j.claimed_by for j in a}) == 1 and a[0].claimed_by != b[0].claimed_by
+    assert all(j.status == "claimed" and j.attempts == 1 for j in a + b)
+    
+    assert repo.run(queue.ack(a)) == 4
+    assert repo.run(queue.release(b)) == 4
+    assert [j.id for j in repo.run(queue.claim(10))] == [5, 6, 7, 8, 9, 10]
+    assert repo.run(queue.claim()) == []
+    assert len(repo.sync.get_all(Job, status="done")) == 4
+
+
+def test_visibility_timeout_requeues(repo):
+    queue = WorkQueue(repo, Job, batch_size=3, visibility_timeout=0)
+    claimed = repo.run(queue.claim())
+    assert repo.run(queue.requeue_expired()) == 3
+    again = repo.run(queue.claim())
+    assert [j.id for j in again] == [j.id for j in claimed]
+    assert all(j.attempts == 2 for j in again)
+    # the expired claim can no longer finish rows claimed by the second consumer
+    assert repo.run(queue.ack(claimed)) == 0
+    assert repo.run(queue.ack(again)) == 3
+
+
+def test_max_attempts_fails_poison_rows(repo):
+    queue = WorkQueue(repo, Job, batch_size=2, visibility_timeout=0, max_attempts=2)
+    assert repo.run(queue.release(repo.run(queue.claim()))) == 2
+    assert repo.run(queue.claim())[0].attempts == 2
+    assert repo.run(queue.requeue_expired()) == 2
+    assert [j.id for j in repo.sync.get_all(Job, status="failed")] == [1, 2]
+    assert [j.id for j in repo.run(queue.claim())] == [3, 4]
+
+
+def test_consumer_cycles_until_empty(repo):
+    queue = WorkQueue(repo, Job, batch_size=4)
+    seen = []
+    
+    
+    async def handler(items):
+        seen.extend(j.payload for j in items)
+    
+    
+    consumer = QueueConsumer("jobs", queue, handler, DEFAULT_SLEEP=1, WAS_WORK_SLEEP=0)
+    results = [repo.run(consumer.async_cycled_func()) for _ in range(4)]
+    assert results == [True, True, True, False]
+    assert seen == [f"p{i}" for i in range(10)]
+    assert len(repo.sync.get_all(Job, status="done")) == 10
+
+
+def test_rows_inserted_with_core_are_claimable(repo):
+    async def insert():
+        async with repo.db.begin() as conn:
+            await conn.execute(text("INSERT INTO jobs (payload) VALUES ('raw')"))
+    
+    
+    repo.run(insert())
+    queue = WorkQueue(repo, Job, batch_size=20, visibility_timeout=0, max_attempts=1)
+    raw = [j for j in repo.run(queue.claim()) if j.payload == "raw"]
+    assert [(j.status, j.attempts) for j in raw] == [("claimed", 1)]
+    assert repo.run(queue.release(raw)) == 1
+    assert repo.sync.get_first(Job, payload="raw").status == "failed"
@@ -0,0 +1,90 @@
+import asyncio
+import os
+from collections import OrderedDict
+
+import yaml
+import yamlordereddictloader
+from beautools.yamlfile import YamlFile
+
+
+
+TEXT = "b: 1\na:\n  z: [1, 2]\n  y: Привет\n"
+
+
+def test_read_keeps_order_and_matches_pure_python_loader(tmp_path):
+    p = tmp_path / "a.yaml"
+    p.write_text(TEXT, encoding="utf-8")
+    yf = YamlFile(p)
+    yf.read()
+    assert isinstance(yf.d, OrderedDict)
+    assert list(yf.d) == ["b", "a"]
+    assert yf.d == yaml.load(TEXT, yamlordereddictloader.Loader)
+
+
+def test_save_is_atomic_and_roundtrips(tmp_path, monkeypatch):
+    p = tmp_path / "a.yaml"
+    p.write_text(TEXT, encoding="utf-8")
+    yf = YamlFile(p)
+    yf.read()
+    yf.d["c"] = 3
+    yf.save()
+    assert os.listdir(tmp_path) == ["a.yaml"]
+    assert list(yaml.load(p.read_text(encoding="utf-8"), yamlordereddictloader.Loader)) == ["b", "a", "c"]
+    
+    def broken_dump(*args, **kwargs):
+        raise RuntimeError("crash")
+    
+    monkeypatch.setattr(yaml, "dump", broken_dump)
+    yf.d["d"] = 4
+    try:
+        yf.save()
+    except RuntimeError:
+        pass
+    assert "d:" not in p.read_text(encoding="utf-8")
+    assert os.listdir(tmp_path) == ["a.yaml"]
+
+
+def test_new_file_gets_umask_mode(tmp_path, monkeypatch):
+    p = tmp_path / "new.yaml"
+    yf = YamlFile(p)
+    yf.d = OrderedDict(a=1)
+    umask = os.umask
+    old = umask(0o022)
+    try:
+        monkeypatch.setattr(os, "umask", None)  # changing the umask would race with other threads
+        yf.save(force=True)
+    finally:
+        umask(old)
+    assert p.stat().st_mode & 0o777 == 0o644
+
+
+def test_track_changes_skips_unchanged(tmp_path):
+    p = tmp_path / "a.yaml"
+    p.write_text(TEXT, encoding="utf-8")
+    yf = YamlFile(p, track_changes=True)
+    assert yf.read() is True
+    assert yf.read() is False
+    assert yf.save() is False
+    
+    yf.d["b"] = 2
+    assert yf.save() is True
+    assert yf.read() is False
+    
+    p.write_text("b: 5\n", encoding="utf-8")
+    os.utime(p, ns=(1, 1))
+    assert yf.read() is True
+    assert yf.d == {"b": 5}
+
+
+def test_aread_asave(tmp_path):
+    p = tmp_path / "a.yaml"
+    p.write_text(TEXT, encoding="utf-8")
+    yf = YamlFile(p)
+    
+    async def main():
+        await yf.aread()
+        yf.d["b"] = 7
+        await yf.asave()
+    
+    asyncio.run(main())
+    assert "b: 7" in p.read_text(encoding="utf-8")